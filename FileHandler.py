@@ -1,15 +1,21 @@
 import unittest
 import os
+import mmap
 
 class FileHandler:
-    def __init__(self, file_path, file_type = 'b'): #Defaults to binary. Can specify text with 't'
+    def __init__(self, file_path, file_type = 'b'): #Defaults to binary. Can specify text with 't' or memory-mapped with 'm'
         self.RAW_DATA = None
         self.path = file_path
         self.type = file_type
         self.binary = True
+        self._file = None
+        self._mmap = None
 
     def read(self): #Fills buffer
-        if self.type in ('b', 'binary'):
+        if self.type in ('m', 'mmap'):
+            self._map()
+
+        elif self.type in ('b', 'binary'):
             with open(self.path, 'rb') as f: 
                 self.RAW_DATA = f.read()
                 self.binary = True 
@@ -22,11 +28,62 @@ class FileHandler:
         else: 
             raise ValueError("Error: Program must specify file_type 't' or 'b'")
     
+    def _map(self): # RAW_DATA becomes a zero-copy memoryview over the file
+        self._unmap()
+        try:
+            self._file = open(self.path, 'r+b')
+            access = mmap.ACCESS_WRITE
+        except PermissionError:
+            self._file = open(self.path, 'rb')
+            access = mmap.ACCESS_READ
+        self.binary = True
+        if os.fstat(self._file.fileno()).st_size == 0: # mmap can't map an empty file
+            self.RAW_DATA = memoryview(b"")
+            return
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=access)
+        self.RAW_DATA = memoryview(self._mmap)
+
+    def _unmap(self):
+        # Slices taken from RAW_DATA (m.RAW_DATA[2:5]) are exports of the mmap itself: release()
+        # on RAW_DATA doesn't end them, and mmap.close() raises BufferError while any is alive
+        try:
+            if isinstance(self.RAW_DATA, memoryview):
+                self.RAW_DATA.release()
+            if self._mmap is not None:
+                self._mmap.close()
+        except BufferError:
+            raise ValueError("Error: Slices of RAW_DATA are still in use. release() them (or take bytes() copies) before close() or write().") from None
+        finally: # Never leave the handler half torn down; a still-exported mapping is freed with its last slice
+            if self._file is not None:
+                self._file.close()
+            self._mmap = None
+            self._file = None
+            self.RAW_DATA = None
+
+    def write_at(self, offset, data): # In-place region write, mmap mode only. Length of the file never changes
+        if self._mmap is None:
+            raise ValueError("Error: write_at needs a non-empty file opened with file_type 'm' and read() first.")
+        if offset < 0 or offset + len(data) > len(self._mmap):
+            raise ValueError(f"Error: Region [{offset}, {offset + len(data)}) is outside the {len(self._mmap)} byte mapping.")
+        if self.RAW_DATA.readonly:
+            raise ValueError("Error: File is read-only, cannot write in place.")
+        self.RAW_DATA[offset:offset + len(data)] = data
+
+    def flush(self): # Push in-place writes to disk
+        if self._mmap is not None:
+            self._mmap.flush()
+
     def write(self, text):  # Writes buffer back to file
         if self.RAW_DATA is None:
             raise ValueError("Use FileHandler.read() to read to internal buffer. Buffer is empty!")
 
-        if self.binary:
+        if self._file is not None: # Whole-file rewrite can change the length, so drop the mapping and map the new file
+            self._unmap()
+            with open(self.path, 'wb') as f:
+                f.write(text)
+            self._map()
+
+        elif self.binary:
             with open(self.path, 'wb') as f:
                 f.write(text)
         else:
@@ -40,7 +97,9 @@ class FileHandler:
         return len(self.RAW_DATA)  
 
     def close(self):
-        if not self.binary and self.RAW_DATA != None:
+        if self._file is not None:
+            self._unmap()
+        elif not self.binary and self.RAW_DATA != None:
             self.RAW_DATA.close()
         else: 
             raise ValueError("Error: Internal Buffer must be empty & close must be in text. Binary autocloses after open.")
@@ -49,6 +108,83 @@ class FileHandler:
         self.close() 
         self.read()
 
+    def read_chunks(self, size=1 << 16, buffer=None): # Streams the file without filling RAW_DATA
+        if self.type in ('t', 'txt'):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for chunk in iter(lambda: f.read(size), ''):
+                    yield chunk
+            return
+
+        # Binary: readinto one preallocated buffer. Each yielded memoryview is only valid until the next one
+        buffer = buffer if buffer is not None else bytearray(size)
+        view = memoryview(buffer)
+        with open(self.path, 'rb') as f:
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                yield view[:n]
+
+    def read_lines(self): # Lines keep their terminator. str in text mode, bytes otherwise
+        mode = 'r' if self.type in ('t', 'txt') else 'rb'
+        with open(self.path, mode, encoding='utf-8' if mode == 'r' else None) as f:
+            for line in f:
+                yield line
+
+    def append(self, data): # Appends without reading the file first
+        mode = 'a' if isinstance(data, str) else 'ab'
+        with open(self.path, mode, encoding='utf-8' if mode == 'a' else None) as f:
+            f.write(data)
+
+    def stream_writer(self, append=True, buffer_size=1 << 16):
+        return ChunkWriter(self.path, 'ab' if append else 'wb', buffer_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._file is not None:
+            self._unmap()
+
+class ChunkWriter: # Buffered writer that reuses one fixed bytearray. str is written as UTF-8
+    def __init__(self, path, mode='ab', buffer_size=1 << 16):
+        self._file = open(path, mode)
+        self._buffer = bytearray(buffer_size)
+        self._view = memoryview(self._buffer)
+        self._used = 0
+
+    def write(self, data):
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        n = len(data)
+        if self._used + n > len(self._buffer):
+            self._drain()
+        if n >= len(self._buffer): # Bigger than the buffer, skip the copy
+            self._file.write(data)
+            return
+        self._view[self._used:self._used + n] = data
+        self._used += n
+
+    def _drain(self):
+        if self._used:
+            self._file.write(self._view[:self._used])
+            self._used = 0
+
+    def flush(self):
+        self._drain()
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
 class Tests(unittest.TestCase):
     def test(self):
         # Setup text file
@@ -83,5 +219,85 @@ class Tests(unittest.TestCase):
         os.remove("test.txt")
         os.remove("test.bin")
 
+    def test_mmap(self):
+        with open("test.bin", "wb") as f:
+            f.write(b"0123456789")
+
+        with FileHandler("test.bin", "m") as m:
+            m.read()
+            self.assertEqual(m.fileLength(), 10)
+            self.assertIsInstance(m.RAW_DATA, memoryview)
+            self.assertEqual(bytes(m.RAW_DATA[2:5]), b"234")
+
+            # In-place region write, visible through the mapping and on disk
+            m.write_at(2, b"ab")
+            m.flush()
+            self.assertEqual(bytes(m.RAW_DATA[:4]), b"01ab")
+            with open("test.bin", "rb") as f:
+                self.assertEqual(f.read(), b"01ab456789")
+
+            with self.assertRaises(ValueError):
+                m.write_at(9, b"xy")
+
+            # Whole-file rewrite remaps at the new length
+            m.write(b"abc")
+            self.assertEqual(m.fileLength(), 3)
+            self.assertEqual(bytes(m.RAW_DATA), b"abc")
+
+        # A slice held across close() or write() is a clear error, and the handler is fully reset
+        with open("test.bin", "wb") as f:
+            f.write(b"0123456789")
+        m = FileHandler("test.bin", "m")
+        m.read()
+        view = m.RAW_DATA[2:5]
+        with self.assertRaises(ValueError):
+            m.write(b"short")
+        self.assertIsNone(m._mmap)
+        self.assertIsNone(m._file)
+        self.assertIsNone(m.RAW_DATA)
+        self.assertEqual(bytes(view), b"234") # Mapping stays valid until the slice goes
+        view.release()
+        with open("test.bin", "rb") as f:
+            self.assertEqual(f.read(), b"0123456789") # Not truncated by the failed write
+
+        m.read()
+        view = m.RAW_DATA[:1]
+        with self.assertRaises(ValueError):
+            m.close()
+        self.assertIsNone(m._file)
+        view.release()
+        m.read() # Reusable after the failed close
+        m.close()
+
+        os.remove("test.bin")
+
+    def test_streaming(self):
+        with open("test.bin", "wb") as f:
+            f.write(b"line1\nline2\nline3")
+
+        b = FileHandler("test.bin", "b")
+        buffer = bytearray(4)
+        chunks = [bytes(chunk) for chunk in b.read_chunks(4, buffer)]
+        self.assertEqual(b"".join(chunks), b"line1\nline2\nline3")
+        self.assertEqual(chunks[0], b"line")
+        self.assertIsNone(b.RAW_DATA)
+        self.assertEqual(list(b.read_lines()), [b"line1\n", b"line2\n", b"line3"])
+
+        t = FileHandler("test.bin", "t")
+        self.assertEqual("".join(t.read_chunks(5)), "line1\nline2\nline3")
+
+        b.append(b"\nline4")
+        with b.stream_writer(buffer_size=8) as w:
+            w.write("\nline5")
+            w.write(b"\nlonger than the buffer")
+        self.assertEqual(list(t.read_lines())[-3:], ["line4\n", "line5\n", "longer than the buffer"])
+
+        with b.stream_writer(append=False) as w:
+            w.write(b"new")
+        b.read()
+        self.assertEqual(b.RAW_DATA, b"new")
+
+        os.remove("test.bin")
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,17 +1,62 @@
 import os
+import io
 import zipfile
 import shutil
+from contextlib import contextmanager
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 text = f"A greenhouse gas is a gas that absorbs and emits radiant energy within the thermal infrared range, causing the greenhouse effect. The primary greenhouse gases in Earth's atmosphere are water vapor (H2O), carbon dioxide (CO2), methane (CH4), nitrous oxide (N2O), and ozone. Without greenhouse gases, the average temperature of Earth's surface would be about -18 °C (0 °F), rather than the present average of 15 °C (59 °F).The atmospheres of Venus, Mars and Titan also contain greenhouse gases."
 
+# Directory entry from a single scandir pass. is_dir/is_file come from the
+# d_type cached by scandir, so no per-entry stat (except to resolve symlinks)
+DirEntryInfo = namedtuple("DirEntryInfo", ["name", "path", "is_dir", "is_file", "is_symlink"])
+
 def currentDir():
     return os.getcwd()
 
+def scanEntries(directory):
+    entries = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+                is_file = entry.is_file()
+            except OSError:  # Dangling symlink or entry removed mid-scan
+                is_dir = is_file = False
+            entries.append(DirEntryInfo(entry.name, entry.path, is_dir, is_file, entry.is_symlink()))
+    return entries
+
+def splitEntries(directory):
+    # One pass for both lists: (directory names, file names)
+    entries = scanEntries(directory)
+    return [e.name for e in entries if e.is_dir], [e.name for e in entries if e.is_file]
+
+def _scanLevel(directory):
+    try:
+        return directory, scanEntries(directory)
+    except OSError:  # Unreadable directory, skipped like os.walk does
+        return directory, None
+
+def walkDirs(directory, workers=8):
+    # Parallel os.walk: yields (dirpath, dirnames, filenames) as each directory's scan completes,
+    # so the order is not top-down. Symlinked directories are not followed.
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_scanLevel, directory)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                dirpath, entries = future.result()
+                if entries is None:
+                    continue
+                for entry in entries:
+                    if entry.is_dir and not entry.is_symlink:
+                        pending.add(pool.submit(_scanLevel, entry.path))
+                yield dirpath, [e.name for e in entries if e.is_dir], [e.name for e in entries if e.is_file]
+
 def listdirs(directory):
     try:
-        entries = os.listdir(directory)
-        directories = [entry for entry in entries if os.path.isdir(os.path.join(directory, entry))]
-        return directories
+        return [entry.name for entry in scanEntries(directory) if entry.is_dir]
     except Exception as e:
         return str(e)
 
@@ -29,9 +74,7 @@ def removeFile(fname):
 
 def listfiles(directory):
     try:
-        entries = os.listdir(directory)
-        files = [entry for entry in entries if os.path.isfile(os.path.join(directory, entry))]
-        return files
+        return [entry.name for entry in scanEntries(directory) if entry.is_file]
     except Exception as e:
         return str(e)
     
@@ -39,6 +82,63 @@ def utilUnzip(zfile):
     with zipfile.ZipFile(zfile,"r") as zf:
         zf.extractall()
 
+def _memberRanges(members, workers):
+    # Split members into `workers` contiguous ranges of roughly equal compressed size
+    total = sum(m.compress_size for m in members) or 1
+    ranges, current, size = [], [], 0
+    for member in members:
+        current.append(member)
+        size += member.compress_size
+        if size >= total * (len(ranges) + 1) / workers and len(ranges) < workers - 1:
+            ranges.append(current)
+            current = []
+    if current:
+        ranges.append(current)
+    return ranges
+
+def _extractRange(zfile, names, destination):
+    # Own ZipFile handle per worker; extract() streams each member through a small buffer
+    with zipfile.ZipFile(zfile, "r") as zf:
+        for name in names:
+            zf.extract(name, destination)
+
+def unzipParallel(zfile, destination=".", workers=4):
+    with zipfile.ZipFile(zfile, "r") as zf:
+        members = zf.infolist()
+    for member in members:  # Directories up front so workers never race on makedirs
+        if member.is_dir():
+            os.makedirs(os.path.join(destination, member.filename), exist_ok=True)
+    files = [m for m in members if not m.is_dir()]
+    ranges = _memberRanges(files, workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # zlib releases the GIL while inflating, so the ranges decompress in parallel
+        futures = [pool.submit(_extractRange, zfile, [m.filename for m in r], destination) for r in ranges]
+        for future in futures:
+            future.result()
+
+@contextmanager
+def openZipMember(zfile, member, encoding="utf-8"):
+    # Stream one member straight out of the archive, decompressed on the fly. Binary if encoding is None.
+    # newline="" leaves line endings alone, as the csv module expects
+    with zipfile.ZipFile(zfile, "r") as zf, zf.open(member) as raw:
+        yield raw if encoding is None else io.TextIOWrapper(raw, encoding=encoding, newline="")
+
+def iterZipMember(zfile, member, size=1 << 16, encoding="utf-8"):
+    # Chunks of one member, e.g. for Cart.split_carts
+    with openZipMember(zfile, member, encoding) as stream:
+        empty = b"" if encoding is None else ""
+        for chunk in iter(lambda: stream.read(size), empty):
+            yield chunk
+
+def writeZip(zfile, members, compression=zipfile.ZIP_DEFLATED):
+    # members: iterable of (name, iterable of str/bytes chunks). Each member is compressed as its
+    # chunks are produced; zfile can be a path or any writable file object, seekable or not
+    with zipfile.ZipFile(zfile, "w", compression) as zf:
+        for name, chunks in members:
+            with zf.open(name, "w", force_zip64=True) as out:  # Size isn't known up front
+                for chunk in chunks:
+                    out.write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+
 def createFile(string):
     fdesc = "temp.txt"
     file = open(fdesc, 'w')
@@ -55,6 +155,50 @@ def readFile(fname):
 def filecopy(source,destination):
     dest = shutil.copy(source, destination)
 
+def _copyFileRange(src, dst, size):
+    remaining = size
+    while remaining > 0:
+        sent = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+        if sent == 0:
+            break
+        remaining -= sent
+
+def _sendFile(src, dst, size):
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+        if sent == 0:
+            break
+        offset += sent
+
+def _zeroCopy(source, destination):
+    # Kernel-side copy: copy_file_range, then sendfile, then a plain buffered copy.
+    # Each step that fails (EXDEV, EINVAL, missing on this platform) falls through to the next
+    if os.path.isdir(destination):
+        destination = os.path.join(destination, os.path.basename(source))
+    if os.path.exists(destination) and os.path.samefile(source, destination):
+        # Opening the destination "wb" would truncate the source; shutil.copy refuses too
+        raise shutil.SameFileError(f"{source!r} and {destination!r} are the same file")
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        size = os.fstat(src.fileno()).st_size
+        for method in (_copyFileRange, _sendFile):
+            try:
+                method(src, dst, size)
+                break
+            except (OSError, AttributeError):  # Unsupported filesystem pair or platform
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+        else:
+            shutil.copyfileobj(src, dst)
+    shutil.copymode(source, destination)
+    return destination
+
+def copyFiles(pairs, workers=8):
+    # Batch copy of (source, destination) pairs on a thread pool. Returns the destination paths in order
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda pair: _zeroCopy(*pair), pairs))
+
 def Validate():
     print("Current Directory",currentDir())
     if os.path.exists("Sandbox") and os.path.isdir("Sandbox"):
@@ -83,6 +227,57 @@ class Tests(unittest.TestCase):
     def test(self):
         success = Validate()
         self.assertEqual(success,True)
+
+    def test_scan(self):
+        import tempfile
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, "a", "b"))
+            for name in ("x.txt", os.path.join("a", "y.txt"), os.path.join("a", "b", "z.txt")):
+                with open(os.path.join(root, name), "w") as f:
+                    f.write(name)
+
+            self.assertEqual(splitEntries(root), (["a"], ["x.txt"]))
+            self.assertEqual(listdirs(root), ["a"])
+            self.assertEqual(listfiles(root), ["x.txt"])
+
+            walked = {os.path.relpath(path, root): (sorted(dirs), sorted(files)) for path, dirs, files in walkDirs(root, workers=2)}
+            expected = {os.path.relpath(path, root): (sorted(dirs), sorted(files)) for path, dirs, files in os.walk(root)}
+            self.assertEqual(walked, expected)
+
+    def test_batch_copy_and_unzip(self):
+        import tempfile
+        with tempfile.TemporaryDirectory() as root:
+            sources = []
+            for i in range(5):
+                path = os.path.join(root, f"src{i}.txt")
+                with open(path, "w") as f:
+                    f.write(text * (i + 1))
+                sources.append(path)
+            out = os.path.join(root, "out")
+            makeDir(out)
+            copied = copyFiles([(path, out) for path in sources], workers=3)
+            self.assertEqual([readFile(path) for path in copied], [readFile(path) for path in sources])
+            with self.assertRaises(shutil.SameFileError):
+                copyFiles([(sources[0], root)])  # Onto itself
+            self.assertEqual(readFile(sources[0]), text)
+
+            archive = os.path.join(root, "bundle.zip")
+            with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+                for path in sources:
+                    zf.write(path, os.path.join("nested", os.path.basename(path)))
+            unzipParallel(archive, os.path.join(root, "unzipped"), workers=2)
+            self.assertEqual(sorted(listfiles(os.path.join(root, "unzipped", "nested"))), sorted(os.path.basename(p) for p in sources))
+
+    def test_zip_streams(self):
+        buffer = io.BytesIO()
+        writeZip(buffer, [("a.csv", (f"{i},{i * i}\n" for i in range(1000))), ("b.bin", [b"\0\1", b"\2"])])
+        buffer.seek(0)
+        with openZipMember(buffer, "a.csv") as stream:
+            self.assertEqual(stream.readline(), "0,0\n")
+        buffer.seek(0)
+        self.assertEqual("".join(iterZipMember(buffer, "a.csv", size=7)), "".join(f"{i},{i * i}\n" for i in range(1000)))
+        buffer.seek(0)
+        self.assertEqual(b"".join(iterZipMember(buffer, "b.bin", encoding=None)), b"\0\1\2")
         
 if __name__=='__main__':
     unittest.main()
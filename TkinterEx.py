@@ -3,8 +3,248 @@ from tkinter import ttk
 from tkinter import scrolledtext
 from tkinter import messagebox
 #from PIL import Image, ImageTk
+import re
 import time
+import operator
 import threading
+import queue
+import unittest
+from functools import lru_cache
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# Calculator expressions: numbers, + - * /, parentheses and unary signs, nothing else
+TOKEN_PATTERN = re.compile(r"\s*(?:(\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)|(.))")
+BINARY_OPERATORS = {
+    '+': (1, operator.add),
+    '-': (1, operator.sub),
+    '*': (2, operator.mul),
+    '/': (2, operator.truediv),
+}
+UNARY_PRECEDENCE = 3
+
+
+class ExpressionError(ValueError):
+    """Malformed calculator expression"""
+
+
+def tokenize(expression):
+    """Split an expression into numbers (int/float) and operator/paren strings"""
+    tokens = []
+    for number, symbol in TOKEN_PATTERN.findall(expression):
+        if number:
+            is_float = '.' in number or 'e' in number or 'E' in number
+            try:
+                tokens.append(float(number) if is_float else int(number))
+            except ValueError:  # Past Python's int/str digit limit
+                raise ExpressionError(f"Number too long: {len(number)} digits") from None
+        elif symbol and not symbol.isspace():
+            if symbol not in BINARY_OPERATORS and symbol not in '()':
+                raise ExpressionError(f"Unexpected character: {symbol!r}")
+            tokens.append(symbol)
+    return tokens
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(expression):
+    """Shunting-yard: expression string -> RPN tuple, cached so repeats skip parsing
+
+    Unary signs become 'u+'/'u-' and bind tighter than * and /, as in Python.
+    """
+    output = []
+    stack = []
+    expect_operand = True
+    for token in tokenize(expression):
+        if not isinstance(token, str):
+            if not expect_operand:
+                raise ExpressionError("Missing operator")
+            output.append(token)
+            expect_operand = False
+        elif token == '(':
+            if not expect_operand:
+                raise ExpressionError("Missing operator before '('")
+            stack.append(token)
+        elif token == ')':
+            if expect_operand:
+                raise ExpressionError("Missing operand before ')'")
+            while stack and stack[-1] != '(':
+                output.append(stack.pop())
+            if not stack:
+                raise ExpressionError("Unbalanced ')'")
+            stack.pop()
+        elif expect_operand:
+            if token not in '+-':
+                raise ExpressionError(f"Missing operand before {token!r}")
+            stack.append('u' + token)  # Right-associative, so nothing is popped
+        else:
+            precedence = BINARY_OPERATORS[token][0]
+            while stack and stack[-1] != '(' and _precedence(stack[-1]) >= precedence:
+                output.append(stack.pop())
+            stack.append(token)
+            expect_operand = True
+    if expect_operand:
+        raise ExpressionError("Incomplete expression")
+    while stack:
+        token = stack.pop()
+        if token == '(':
+            raise ExpressionError("Unbalanced '('")
+        output.append(token)
+    return tuple(output)
+
+
+def _precedence(token):
+    return UNARY_PRECEDENCE if token in ('u+', 'u-') else BINARY_OPERATORS[token][0]
+
+
+def evaluate(expression):
+    """Value of a calculator expression; same results as eval() for the operators it allows
+
+    Raises ExpressionError for malformed input and ZeroDivisionError for x/0.
+    """
+    values = []
+    for token in compile_expression(expression):
+        if not isinstance(token, str):
+            values.append(token)
+        elif token == 'u-':
+            values.append(-values.pop())
+        elif token == 'u+':
+            values.append(+values.pop())
+        else:
+            right = values.pop()
+            values.append(BINARY_OPERATORS[token][1](values.pop(), right))
+    return values[0]
+
+
+def evaluate_many(expressions):
+    """evaluate() over a list; failures come back as their exception instead of raising"""
+    results = []
+    for expression in expressions:
+        try:
+            results.append(evaluate(expression))
+        except (ExpressionError, ArithmeticError) as e:
+            results.append(e)
+    return results
+
+
+class TaskCancelled(Exception):
+    """Raised by TaskHandle.check() inside a task once cancel() was called"""
+
+
+class TaskHandle:
+    """One task submitted to a TaskRunner
+
+    Thread tasks receive their handle as the first argument: report(value, message)
+    publishes progress (only the latest report is kept, so reporting every step
+    costs nothing) and check() raises TaskCancelled after cancel().
+    """
+
+    def __init__(self, on_progress=None, on_done=None, on_error=None, on_cancel=None):
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_cancel = on_cancel
+        self.future = None
+        self._cancel = threading.Event()
+        self._latest = None  # (value, message), replaced by the worker
+        self._shown = None
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+        if self.future is not None:
+            self.future.cancel()  # Only stops tasks that haven't started
+
+    def check(self):
+        if self._cancel.is_set():
+            raise TaskCancelled()
+
+    def report(self, value, message=None):
+        self._latest = (value, message)  # One attribute store, safe from any thread
+
+    def _deliver_progress(self):
+        latest = self._latest
+        if latest is not None and latest is not self._shown:
+            self._shown = latest
+            if self.on_progress:
+                self.on_progress(*latest)
+
+
+class TaskRunner:
+    """Runs work in a thread (or process) pool and hands results to the Tk thread
+
+    Widgets are only ever touched from callbacks run by Tk: workers publish
+    progress on their handle and finished futures go through a queue, which
+    is polled with after() while tasks are active. Progress redraws are
+    coalesced to at most one per redraw_ms. With processes=True tasks get no
+    handle (it can't cross the process boundary), so they report no progress
+    and can only be cancelled before they start.
+    """
+
+    def __init__(self, root, max_workers=2, processes=False, poll_ms=30, redraw_ms=100):
+        self.root = root
+        self.processes = processes
+        self.poll_ms = poll_ms
+        self.redraw_ms = redraw_ms
+        pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        self.executor = pool(max_workers=max_workers)
+        self._finished = queue.Queue()  # (handle, future) from the pool's threads
+        self._tasks = set()
+        self._polling = False
+        self._last_redraw = 0.0
+
+    def submit(self, func, *args, on_progress=None, on_done=None, on_error=None, on_cancel=None):
+        handle = TaskHandle(on_progress, on_done, on_error, on_cancel)
+        if self.processes:
+            handle.future = self.executor.submit(func, *args)
+        else:
+            handle.future = self.executor.submit(func, handle, *args)
+        handle.future.add_done_callback(lambda future: self._finished.put((handle, future)))
+        self._tasks.add(handle)
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+        return handle
+
+    def cancel_all(self):
+        for handle in list(self._tasks):
+            handle.cancel()
+
+    def shutdown(self):
+        self.cancel_all()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _poll(self):
+        now = time.monotonic()
+        if now - self._last_redraw >= self.redraw_ms / 1000:
+            self._last_redraw = now
+            for handle in list(self._tasks):  # A progress callback may submit() another task
+                handle._deliver_progress()
+
+        while True:
+            try:
+                handle, future = self._finished.get_nowait()
+            except queue.Empty:
+                break
+            self._tasks.discard(handle)
+            if future.cancelled() or handle.cancelled or isinstance(future.exception(), TaskCancelled):
+                if handle.on_cancel:
+                    handle.on_cancel()
+            elif future.exception() is not None:
+                if handle.on_error:
+                    handle.on_error(future.exception())
+            else:
+                handle._deliver_progress()  # Final progress, even if inside the redraw interval
+                if handle.on_done:
+                    handle.on_done(future.result())
+
+        if self._tasks:
+            self.root.after(self.poll_ms, self._poll)
+        else:
+            self._polling = False
+
 
 def textBox():
     
@@ -109,17 +349,43 @@ def radioButton():
 
 def progressBar():
 
+    def task(handle, steps):
+        # Runs on a pool thread: it only reports progress, the widgets are updated by the runner
+        total = 0
+        for i in range(1, steps + 1):
+            handle.check()  # Raises TaskCancelled after Cancel
+            total += sum(range(2000))  # Simulate a step of work
+            handle.report(i * 100 // steps, f"Progress: {i * 100 // steps}%")
+        return total
+
+    def show_progress(value, message):
+        progress_bar["value"] = value
+        progress_label.config(text=message)
+
+    def finish(text):
+        progress_label.config(text=text)
+        start_button.config(state=tk.NORMAL)
+        cancel_button.config(state=tk.DISABLED)
+
     def start_progress():
-        # Simulate a task in a separate thread to avoid freezing the GUI
-        def task():
-            progress_bar["value"] = 0  # Reset progress bar
-            for i in range(1, 101):  # Simulating 100 steps
-                time.sleep(0.05)  # Simulate work with a delay
-                progress_bar["value"] = i  # Update progress bar value
-                progress_label.config(text=f"Progress: {i}%")  # Update progress label
-            progress_label.config(text="Task Complete!")
+        progress_bar["value"] = 0  # Reset progress bar
+        start_button.config(state=tk.DISABLED)
+        cancel_button.config(state=tk.NORMAL)
+        current["task"] = runner.submit(
+            task, 20000,
+            on_progress=show_progress,
+            on_done=lambda result: finish("Task Complete!"),
+            on_error=lambda e: finish(f"Task failed: {e}"),
+            on_cancel=lambda: finish("Task Cancelled")
+        )
+
+    def cancel_progress():
+        if current["task"] is not None:
+            current["task"].cancel()
 
-        threading.Thread(target=task).start()
+    def close():
+        runner.shutdown()
+        root.destroy()
 
     # Set up the main window
     root = tk.Tk()
@@ -134,9 +400,16 @@ def progressBar():
     progress_label = tk.Label(root, text="Click 'Start' to begin")
     progress_label.pack(pady=10)
 
-    # Create and place the Start button
+    # Create and place the Start and Cancel buttons
     start_button = tk.Button(root, text="Start", command=start_progress)
-    start_button.pack(pady=10)
+    start_button.pack(pady=5)
+    cancel_button = tk.Button(root, text="Cancel", command=cancel_progress, state=tk.DISABLED)
+    cancel_button.pack(pady=5)
+
+    # Background work goes through the runner; only it touches the widgets, from the Tk thread
+    runner = TaskRunner(root)
+    current = {"task": None}
+    root.protocol("WM_DELETE_WINDOW", close)
 
     # Start the GUI main loop
     root.mainloop()
@@ -369,10 +642,11 @@ def calculator():
         # Handle special buttons like "=" and "C"
         if text == "=":
             try:
-                # Evaluate the expression and update the display
-                result = str(eval(display_var.get()))
+                # Evaluate the expression (parsed once, then cached) and update the display
+                result = str(evaluate(display_var.get()))
                 display_var.set(result)
-            except Exception as e:
+            except (ExpressionError, ArithmeticError, ValueError):
+                # ValueError: str() of a result past Python's int/str digit limit
                 display_var.set("Error")
         elif text == "C":
             # Clear the display
@@ -435,6 +709,92 @@ def button():
     # Start the Tkinter event loop
     root.mainloop()
     
+def receiptsDashboard():
+
+    def start_server():
+        # Server and client run on an asyncio loop in their own thread; only the queue crosses over
+        import asyncio
+        import sockets
+        threading.Thread(target=lambda: asyncio.run(sockets.run_main(events=events)), daemon=True).start()
+        start_button.config(state=tk.DISABLED)
+        status_label.config(text="Server running on 127.0.0.1:8888")
+
+    def drain_events():
+        # Take what arrived since the last tick (capped so a burst can't stall Tk), then redraw once
+        for _ in range(2000):
+            try:
+                event = events.get_nowait()
+            except queue.Empty:
+                break
+            if event.kind == "scan":
+                stats["scans"] += 1
+                scan_times.append(event.timestamp)
+                latencies.append(event.latency)
+                if event.product is None:
+                    stats["errors"] += 1
+                else:
+                    stats["cart"] += event.price
+                    recent_list.insert(0, f"{event.product}: ${event.price:.2f}")
+            elif event.kind == "cart":
+                stats["carts"] += 1
+                stats["cart"] = 0.0
+                stats["revenue"] += event.price
+                totals_list.insert(0, f"Cart {stats['carts']}: ${event.price:.2f}")
+
+        # Keep the listboxes short; the full history isn't needed on screen
+        recent_list.delete(200, tk.END)
+        totals_list.delete(200, tk.END)
+
+        now = time.time()
+        while scan_times and scan_times[0] < now - 5:
+            scan_times.popleft()
+        ordered = sorted(latencies)
+        if ordered:
+            average = sum(ordered) / len(ordered) * 1000
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000
+        else:
+            average = p95 = 0.0
+
+        throughput_label.config(text=f"Throughput: {len(scan_times) / 5:.1f} scans/s  ({stats['scans']} total, {stats['errors']} invalid)")
+        latency_label.config(text=f"Latency: avg {average:.2f} ms, p95 {p95:.2f} ms (last {len(ordered)})")
+        cart_label.config(text=f"Current cart: ${stats['cart']:.2f}   Carts: {stats['carts']}   Revenue: ${stats['revenue']:.2f}")
+        root.after(100, drain_events)
+
+    # Create the main window
+    root = tk.Tk()
+    root.title("Live Receipts Dashboard")
+    root.geometry("600x450")
+
+    # Thread-safe queue the BarcodeServer posts ServerEvents to; drained from Tk with after()
+    events = queue.Queue()
+    stats = {"scans": 0, "errors": 0, "carts": 0, "cart": 0.0, "revenue": 0.0}
+    scan_times = deque()  # Timestamps of scans in the last 5 seconds
+    latencies = deque(maxlen=500)
+
+    status_label = tk.Label(root, text="Click 'Start' to run the barcode server and client")
+    status_label.pack(pady=5)
+    throughput_label = tk.Label(root, font=("Arial", 12))
+    throughput_label.pack(anchor=tk.W, padx=10)
+    latency_label = tk.Label(root, font=("Arial", 12))
+    latency_label.pack(anchor=tk.W, padx=10)
+    cart_label = tk.Label(root, font=("Arial", 12))
+    cart_label.pack(anchor=tk.W, padx=10)
+
+    lists = tk.Frame(root)
+    lists.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+    recent_list = tk.Listbox(lists)
+    recent_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    totals_list = tk.Listbox(lists)
+    totals_list.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+
+    start_button = tk.Button(root, text="Start", command=start_server)
+    start_button.pack(pady=5)
+
+    drain_events()
+
+    # Run the application
+    root.mainloop()
+
 def run():
     button()
     calculator()
@@ -448,5 +808,104 @@ def run():
     radioButton()
     showImage()
     textBox()    
+    receiptsDashboard()
     
-run()
+class Tests(unittest.TestCase):
+    def test_evaluate(self):
+        for expression in ["1+2*3", "(1+2)*3", "7/2", "8/2", "-3+2", "2*-3", "-(4-6)*2",
+                           "1.5e3/3", ".5+1", "10-4-3", "2*3/4*5", "--2", "1e+20*10"]:
+            self.assertEqual(evaluate(expression), eval(expression), expression)
+        long_expression = "+".join(["1*2"] * 5000)
+        self.assertEqual(evaluate(long_expression), 10000)
+
+    def test_errors(self):
+        for expression in ["", "1+", "*2", "(1+2", "1+2)", "2(3)", "__import__('os')", "1 2"]:
+            self.assertRaises(ExpressionError, evaluate, expression)
+        self.assertRaises(ZeroDivisionError, evaluate, "1/0")
+        results = evaluate_many(["1+1", "1/0", "1+"])
+        self.assertEqual(results[0], 2)
+        self.assertIsInstance(results[1], ZeroDivisionError)
+        self.assertIsInstance(results[2], ExpressionError)
+        self.assertIsInstance(evaluate_many(['1' * 5000])[0], ExpressionError)
+
+    class FakeRoot:
+        """Stands in for Tk: after() callbacks run in order, without a display"""
+
+        def __init__(self):
+            self.pending = deque()
+
+        def after(self, ms, func):
+            self.pending.append(func)
+
+        def run(self, timeout=5):
+            deadline = time.monotonic() + timeout
+            while self.pending and time.monotonic() < deadline:
+                self.pending.popleft()()
+                time.sleep(0.001)
+
+    def runner(self, **kwargs):
+        root = self.FakeRoot()
+        runner = TaskRunner(root, **kwargs)
+        self.addCleanup(runner.shutdown)
+        return root, runner
+
+    def test_task_progress(self):
+        def task(handle):
+            for i in range(1, 501):
+                handle.report(i, f"{i}%")
+            return "done"
+
+        root, runner = self.runner(redraw_ms=60000)
+        events = []
+        runner.submit(task, on_progress=lambda value, message: events.append(value),
+                      on_done=events.append)
+        root.run()
+        # Reports within redraw_ms are merged; the final one still arrives before on_done
+        self.assertEqual(events[-2:], [500, "done"])
+        self.assertLessEqual(len(events), 3)
+
+    def test_task_cancel_and_error(self):
+        def forever(handle):
+            while True:
+                handle.check()
+                time.sleep(0.001)
+
+        def fail(handle):
+            raise ValueError("boom")
+
+        root, runner = self.runner()
+        events = []
+        handle = runner.submit(forever, on_done=events.append, on_error=events.append,
+                               on_cancel=lambda: events.append("cancelled"))
+        handle.cancel()
+        runner.submit(fail, on_done=events.append, on_error=lambda e: events.append(repr(e)))
+        root.run()
+        self.assertEqual(sorted(events), ["ValueError('boom')", "cancelled"])
+
+    def test_submit_from_callback(self):
+        second_ran = threading.Event()
+
+        def first(handle):
+            handle.report(1)
+            second_ran.wait(5)
+            return "first"
+
+        def second(handle):
+            second_ran.set()
+            return "second"
+
+        root, runner = self.runner(redraw_ms=0)
+        events = []
+
+        def on_progress(value, message):
+            if not events:
+                events.append("submitted")
+                runner.submit(second, on_done=events.append)
+
+        runner.submit(first, on_progress=on_progress, on_done=events.append)
+        root.run()
+        self.assertEqual(sorted(events), ["first", "second", "submitted"])
+
+
+if __name__ == "__main__":
+    run()
@@ -1,20 +1,226 @@
 import re
-import requests
-from bs4 import BeautifulSoup
-from collections import defaultdict
-import urllib.request
+import os
+import json
+import codecs
+import hashlib
+import importlib.util
+import threading
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+from lazy_imports import lazy_import
+
+requests = lazy_import("requests")
+bs4 = lazy_import("bs4")
+
+
+def best_parser():
+    """'lxml' when installed (C parser, several times faster), else the stdlib 'html.parser'"""
+    return 'lxml' if importlib.util.find_spec('lxml') is not None else 'html.parser'
+
+TABLE_TAGS = ('table', 'thead', 'tbody', 'tfoot', 'tr', 'th', 'td')
+
+
+def collect_table_tags(soup, serialize=False):
+    """Every TABLE_TAGS element of a parsed soup, by tag, in one traversal
+    
+    find_all with a list of names walks the tree once and returns document order.
+    With serialize, each element is stored as str() instead of the element itself.
+    """
+    buckets = {tag: [] for tag in TABLE_TAGS}
+    for element in soup.find_all(TABLE_TAGS):
+        buckets[element.name].append(element)
+    if serialize:
+        return {tag: [str(e) for e in elements] for tag, elements in buckets.items()}
+    return buckets
+
+# One compiled pattern per tag for TableScraperRE.scrape_tables
+TAG_PATTERNS = {
+    tag: re.compile(rf'<{tag}[^>]*>(.*?)</{tag}>', re.DOTALL) for tag in TABLE_TAGS
+}
+
+# Single-pass tokenizer: every table tag, open or close, plus comments to skip
+TABLE_TOKEN_PATTERN = re.compile(
+    r'<(?:(/?)(t(?:able|head|body|foot|[rhd]))\b[^>]*|!--.*?--)>',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Tags an opening tag closes implicitly when they are still open (HTML's optional end tags)
+IMPLICIT_CLOSE = {
+    'td': ('td', 'th'),
+    'th': ('td', 'th'),
+    'tr': ('td', 'th', 'tr'),
+    'thead': ('td', 'th', 'tr', 'thead', 'tbody', 'tfoot'),
+    'tbody': ('td', 'th', 'tr', 'thead', 'tbody', 'tfoot'),
+    'tfoot': ('td', 'th', 'tr', 'thead', 'tbody', 'tfoot'),
+}
+
+class HttpCache:
+    """Disk cache of page bodies keyed by URL, for conditional revalidation
+    
+    Each entry is <sha256(url)>.body plus a .json with the URL, ETag,
+    Last-Modified and encoding. Entries are evicted least recently used first
+    (by the .json mtime, refreshed on every hit) once the bodies exceed max_bytes.
+    """
+    
+    def __init__(self, directory=".http_cache", max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+    
+    def _path(self, url, suffix):
+        return os.path.join(self.directory, hashlib.sha256(url.encode()).hexdigest() + suffix)
+    
+    def _write(self, path, data):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
+    def lookup(self, url):
+        """Return the entry's metadata dict, or None if the URL isn't cached"""
+        try:
+            with open(self._path(url, '.json'), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get('url') != url or not os.path.exists(self._path(url, '.body')):
+            return None
+        return meta
+    
+    def conditional_headers(self, meta):
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+    
+    def read_text(self, url, meta):
+        """Cached body for a 304 on meta's validators, or None if it was evicted or replaced since"""
+        with self._lock:  # store()/_evict() from other fetch threads can't interleave
+            current = self.lookup(url)
+            if current is None or current != meta:
+                return None
+            try:
+                with open(self._path(url, '.body'), 'rb') as f:
+                    body = f.read()
+                os.utime(self._path(url, '.json'))  # Recently used
+            except OSError:
+                return None
+        return body.decode(meta.get('encoding') or 'utf-8', errors='replace')
+    
+    def store(self, url, response):
+        """Cache a 200 response if it carries a validator (ETag or Last-Modified)"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        meta = {'url': url, 'etag': etag, 'last_modified': last_modified,
+                'encoding': response.encoding or response.apparent_encoding,
+                'size': len(response.content)}
+        with self._lock:
+            self._write(self._path(url, '.body'), response.content)
+            self._write(self._path(url, '.json'), json.dumps(meta).encode('utf-8'))
+            self._evict()
+    
+    def _evict(self):
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            meta_path = os.path.join(self.directory, name)
+            body_path = meta_path[:-len('.json')] + '.body'
+            try:
+                size = os.path.getsize(body_path)
+                entries.append((os.path.getmtime(meta_path), meta_path, body_path, size))
+            except OSError:
+                continue
+            total += size
+        for _, meta_path, body_path, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for path in (meta_path, body_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+
 
 class FileHandler:
-    """Class for handling file operations including web page scraping"""
+    """Class for handling file operations including web page scraping
     
-    def __init__(self):
+    Requests go through one pooled requests.Session, so repeated fetches to a
+    host reuse its TCP/TLS connection, with a timeout and retries on
+    connection errors and 429/5xx responses. With an HttpCache, pages that
+    carry an ETag or Last-Modified are revalidated with a conditional GET and
+    served from disk on 304 Not Modified.
+    """
+    
+    def __init__(self, timeout=10, retries=2, backoff=0.5, pool_size=16, cache=None):
         self.content = None
+        self.cache = cache
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.pool_size = pool_size
+        self._session = None
+        self._host_limits = {}
+        self._host_lock = threading.Lock()
+        self._session_lock = threading.Lock()
+    
+    @property
+    def session(self):
+        if self._session is not None:
+            return self._session
+        # fetch_many's workers can all get here at once: build one session (and do the
+        # first touch of the lazily loaded requests module, which isn't thread-safe) under a lock
+        with self._session_lock:
+            if self._session is not None:
+                return self._session
+            from urllib3.util.retry import Retry
+            retry = Retry(total=self.retries, backoff_factor=self.backoff,
+                          status_forcelist=(429, 500, 502, 503, 504),
+                          allowed_methods=('GET', 'HEAD'), raise_on_status=False)
+            adapter = requests.adapters.HTTPAdapter(pool_connections=self.pool_size,
+                                                    pool_maxsize=self.pool_size, max_retries=retry)
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._session = session  # Published only once fully mounted
+        return self._session
     
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+    
+    def _get_text(self, url):
+        if self.cache is None:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()  # Raise an exception for HTTP errors
+            return response.text
+
+        meta = self.cache.lookup(url)
+        headers = self.cache.conditional_headers(meta) if meta else {}
+        response = self.session.get(url, timeout=self.timeout, headers=headers)
+        if response.status_code == 304 and meta:
+            text = self.cache.read_text(url, meta)
+            if text is not None:
+                return text
+            # Evicted by another thread during the round trip: fetch the body unconditionally
+            response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        self.cache.store(url, response)
+        return response.text
+
     def read_webpage(self, url):
         try:
-            response = requests.get(url)
-            response.raise_for_status()  # Raise an exception for HTTP errors
-            self.content = response.text
+            self.content = self._get_text(url)
             return self.content
         except requests.exceptions.RequestException as e:
             print(f"Error reading webpage: {e}")
@@ -23,53 +229,292 @@ class FileHandler:
     def get_content(self):
         return self.content
 
+    def _host_limit(self, url, per_host):
+        # Keyed on the limit too, so a later fetch_many with another per_host gets its own
+        key = (urlsplit(url).netloc, per_host)
+        with self._host_lock:
+            if key not in self._host_limits:
+                self._host_limits[key] = threading.BoundedSemaphore(per_host)
+            return self._host_limits[key]
+
+    def _fetch(self, url, per_host):
+        with self._host_limit(url, per_host):
+            try:
+                return self._get_text(url)
+            except requests.exceptions.RequestException as e:
+                print(f"Error reading webpage: {e}")
+                return None
+
+    def fetch_many(self, urls, max_workers=8, per_host=4):
+        """Fetch several pages concurrently over the pooled session
+        
+        Args:
+            urls (list): URLs to fetch
+            max_workers (int): Requests in flight overall
+            per_host (int): Requests in flight per host
+            
+        Returns:
+            dict: url -> page text, or None for a failed fetch (like read_webpage)
+        """
+        urls = list(dict.fromkeys(urls))
+        self.session  # Built here, before the workers race for it
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            pages = pool.map(lambda url: self._fetch(url, per_host), urls)
+            return dict(zip(urls, pages))
+
+    def iter_webpage(self, url, chunk_size=1 << 16):
+        """Yield the page body as decoded text chunks, without keeping it in memory
+        
+        Args:
+            url (str): URL to fetch
+            chunk_size (int): Bytes read from the socket per chunk
+            
+        Yields:
+            str: Chunks of the page, for stream_table_rows
+        """
+        try:
+            with self.session.get(url, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                if response.encoding is None:
+                    response.encoding = 'utf-8'
+                for chunk in response.iter_content(chunk_size, decode_unicode=True):
+                    yield chunk
+        except requests.exceptions.RequestException as e:
+            print(f"Error reading webpage: {e}")
+
+
+# A completed table row. table: document-order index of its <table>; heading: text of the
+# last <h2>/<h3> before that table opened; header: True if every cell was a <th>
+# header: every cell is a <th>; tags: "td" or "th" for each cell, in order
+TableRow = namedtuple("TableRow", ["table", "heading", "cells", "header", "tags"])
+
+
+class StreamingTableParser(HTMLParser):
+    """Incremental table parser built on html.parser
+    
+    feed() it HTML in chunks and collect finished rows with take_rows(); only
+    the rows completed since the last call are held, never the document.
+    Cell text matches BeautifulSoup's get_text(strip=True).
+    """
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = []
+        self._tables = []  # Open tables, innermost last
+        self._table_count = 0
+        self._heading = None
+        self._heading_parts = None
+        self._text = []  # Raw pieces of the current text node; feed() splits nodes at chunk ends
+    
+    def take_rows(self):
+        rows, self.rows = self.rows, []
+        return rows
+    
+    def handle_starttag(self, tag, attrs):
+        self._end_text()
+        if tag in ('h2', 'h3'):
+            self._heading_parts = []
+        elif tag == 'table':
+            self._tables.append({'index': self._table_count, 'heading': self._heading,
+                                 'row': None, 'tags': None, 'cell': None, 'header': True})
+            self._table_count += 1
+        elif not self._tables:
+            return
+        elif tag == 'tr':
+            self._end_row()
+            self._tables[-1]['row'] = []
+            self._tables[-1]['tags'] = []
+        elif tag in ('td', 'th'):
+            self._end_cell()
+            table = self._tables[-1]
+            if table['row'] is None:  # Cell without a <tr>
+                table['row'] = []
+                table['tags'] = []
+            table['cell'] = []
+            table['tags'].append(tag)
+            if tag == 'td':
+                table['header'] = False
+    
+    def handle_endtag(self, tag):
+        self._end_text()
+        if tag in ('h2', 'h3') and self._heading_parts is not None:
+            self._heading = ''.join(self._heading_parts)
+            self._heading_parts = None
+        elif not self._tables:
+            return
+        elif tag in ('td', 'th'):
+            self._end_cell()
+        elif tag == 'tr':
+            self._end_row()
+        elif tag == 'table':
+            self._end_row()
+            self._tables.pop()
+    
+    def handle_data(self, data):
+        self._text.append(data)
+    
+    def handle_comment(self, data):
+        self._end_text()  # A comment separates text nodes, as in BeautifulSoup
+    
+    def _end_text(self):
+        # Strip whole text nodes, like get_text(strip=True), never the pieces feed() delivers
+        if not self._text:
+            return
+        text = ''.join(self._text).strip()
+        self._text = []
+        if not text:
+            return
+        if self._heading_parts is not None:
+            self._heading_parts.append(text)
+        if self._tables and self._tables[-1]['cell'] is not None:
+            self._tables[-1]['cell'].append(text)
+    
+    def _end_cell(self):
+        table = self._tables[-1]
+        if table['cell'] is not None:
+            table['row'].append(''.join(table['cell']))
+            table['cell'] = None
+    
+    def _end_row(self):
+        self._end_cell()
+        table = self._tables[-1]
+        if table['row'] is not None:
+            if table['row']:
+                self.rows.append(TableRow(table['index'], table['heading'], table['row'], table['header'],
+                                          table['tags']))
+            table['row'] = None
+            table['tags'] = None
+        table['header'] = True
+    
+    def close(self):
+        super().close()
+        self._end_text()
+        while self._tables:  # Unclosed tables at end of document
+            self._end_row()
+            self._tables.pop()
+
+
+def stream_table_rows(chunks):
+    """Yield TableRow tuples as soon as each row is complete
+    
+    Args:
+        chunks (iterable): HTML as str or bytes chunks (bytes are decoded as UTF-8),
+            e.g. FileHandler.iter_webpage(url)
+            
+    Yields:
+        TableRow: Completed rows, in document order
+    """
+    parser = StreamingTableParser()
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        parser.feed(chunk)
+        yield from parser.take_rows()
+    parser.feed(decoder.decode(b'', final=True))
+    parser.close()
+    yield from parser.take_rows()
+
 
 class TableScraperRE:
     """Class for scraping tables from HTML using Regular Expressions"""
     
     def __init__(self):
         self.table_data = defaultdict(list)
+        self.structure = []
     
-    def scrape_tables(self, html_content):
+    def scrape_tables(self, html_content, single_pass=False):
         """Scrape tables from HTML content using RE
         
         Args:
             html_content (str): HTML content to scrape
+            single_pass (bool): Use tokenize_tables instead of one regex scan per tag
             
         Returns:
             defaultdict: Dictionary with table elements
         """
-        # Find all table tags
-        table_pattern = re.compile(r'<table[^>]*>(.*?)</table>', re.DOTALL)
-        tables = table_pattern.findall(html_content)
-        
-        # Store the complete tables
-        self.table_data['table'] = tables
-        
-        # Find thead tags
-        thead_pattern = re.compile(r'<thead[^>]*>(.*?)</thead>', re.DOTALL)
-        self.table_data['thead'] = thead_pattern.findall(html_content)
-        
-        # Find tbody tags
-        tbody_pattern = re.compile(r'<tbody[^>]*>(.*?)</tbody>', re.DOTALL)
-        self.table_data['tbody'] = tbody_pattern.findall(html_content)
-        
-        # Find tfoot tags
-        tfoot_pattern = re.compile(r'<tfoot[^>]*>(.*?)</tfoot>', re.DOTALL)
-        self.table_data['tfoot'] = tfoot_pattern.findall(html_content)
-        
-        # Find tr tags
-        tr_pattern = re.compile(r'<tr[^>]*>(.*?)</tr>', re.DOTALL)
-        self.table_data['tr'] = tr_pattern.findall(html_content)
+        if single_pass:
+            return self.tokenize_tables(html_content)
+
+        # One scan of the document per tag, in TABLE_TAGS order
+        for tag, pattern in TAG_PATTERNS.items():
+            self.table_data[tag] = pattern.findall(html_content)
         
-        # Find th tags
-        th_pattern = re.compile(r'<th[^>]*>(.*?)</th>', re.DOTALL)
-        self.table_data['th'] = th_pattern.findall(html_content)
+        return self.table_data
+
+    def tokenize_tables(self, html_content, structure=False):
+        """Scrape tables in a single walk over the document
         
-        # Find td tags
-        td_pattern = re.compile(r'<td[^>]*>(.*?)</td>', re.DOTALL)
-        self.table_data['td'] = td_pattern.findall(html_content)
+        Unlike the per-tag regexes, tags are matched by exact name (<th> no
+        longer matches <thead>), nested tables keep their full inner HTML,
+        optional end tags (</td>, </tr>, ...) are closed implicitly and
+        comments are skipped.
         
+        Args:
+            html_content (str): HTML content to scrape
+            structure (bool): Also keep the nesting in self.structure as
+                {'tag', 'start', 'end', 'children'} nodes, start/end being the
+                offsets of the element's inner HTML. Off by default: the
+                per-node dicts cost more than the scan itself.
+            
+        Returns:
+            defaultdict: Dictionary with table elements, in document order
+        """
+        buckets = {tag: [] for tag in TABLE_TAGS}
+        roots = []
+        nodes = []    # Open structure nodes, innermost last (structure=True only)
+        starts = []   # Inner HTML offset of each open element
+        tags = []     # Tag of each open element
+        indexes = []  # Bucket index of each open element
+
+        def close_top(end):
+            buckets[tags.pop()][indexes.pop()] = html_content[starts.pop():end]
+            if structure:
+                nodes.pop()['end'] = end
+
+        for match in TABLE_TOKEN_PATTERN.finditer(html_content):
+            closing, tag = match.group(1, 2)
+            if tag is None:
+                continue  # Comment
+            if tag not in buckets:
+                tag = tag.lower()
+
+            if closing:
+                if tags and tags[-1] == tag:  # Well-formed, the common case: close_top inlined
+                    tags.pop()
+                    buckets[tag][indexes.pop()] = html_content[starts.pop():match.start()]
+                    if structure:
+                        nodes.pop()['end'] = match.start()
+                    continue
+                if tag not in tags:
+                    continue  # Stray close tag
+                innermost = len(tags) - 1 - tags[::-1].index(tag)
+                if 'table' in tags[innermost + 1:]:
+                    continue  # Belongs to an outer table, not the current one
+                while len(tags) > innermost:  # Close it and anything left open inside it
+                    close_top(match.start())
+                continue
+
+            implicit = IMPLICIT_CLOSE.get(tag)
+            if implicit:
+                while tags and tags[-1] in implicit:
+                    close_top(match.start())
+            if structure:
+                node = {'tag': tag, 'start': match.end(), 'end': None, 'children': []}
+                (nodes[-1]['children'] if nodes else roots).append(node)
+                nodes.append(node)
+            bucket = buckets[tag]
+            indexes.append(len(bucket))
+            bucket.append(None)
+            starts.append(match.end())
+            tags.append(tag)
+
+        while tags:  # Unclosed at end of document
+            close_top(len(html_content))
+
+        for tag in TABLE_TAGS:
+            self.table_data[tag] = buckets[tag]
+        self.structure = roots
         return self.table_data
     
     def get_table_count(self):
@@ -99,16 +544,26 @@ class TableScraperBS4:
         self.table_data = defaultdict(list)
         self.soup = None
     
-    def scrape_tables(self, html_content):
+    def scrape_tables(self, html_content, single_walk=False, serialize=False, parser='html.parser'):
         """Scrape tables from HTML content using BeautifulSoup
         
         Args:
             html_content (str): HTML content to scrape
+            single_walk (bool): Collect every table tag in one traversal instead of one find_all per tag
+            serialize (bool): With single_walk, store str() of each element instead of
+                the element itself (the per-tag path always stores strings)
+            parser (str): BeautifulSoup parser; 'auto' picks best_parser()
             
         Returns:
             defaultdict: Dictionary with table elements
         """
-        self.soup = BeautifulSoup(html_content, 'html.parser')
+        if parser == 'auto':
+            parser = best_parser()
+        self.soup = bs4.BeautifulSoup(html_content, parser)
+
+        if single_walk:
+            self.table_data.update(collect_table_tags(self.soup, serialize))
+            return self.table_data
         
         # Find all table tags
         tables = self.soup.find_all('table')
@@ -160,17 +615,82 @@ class TableScraperBS4:
         return stats
 
 
-def compare_scrapers(url):
+def _scrape_document(html_content, engines=('re', 'bs4'), parser='html.parser', frames=False):
+    """Parse one page in a worker process and return only picklable summaries
+    
+    Soups and regex matches stay in the worker; the parent gets tag counts per
+    engine and, with frames=True, {heading: DataFrame} for the page's tables.
+    """
+    result = {}
+    if 're' in engines:
+        re_scraper = TableScraperRE()
+        re_scraper.scrape_tables(html_content)
+        result['re'] = re_scraper.get_statistics()
+    if 'bs4' not in engines and not frames:
+        return result
+
+    if frames:
+        # dfmodule's scraper also indexes headings; parse once and take the stats from it too
+        from dfmodule import TableScraperBS4 as FrameScraper, EmptyTableError, htmlToDf  # dfmodule imports this module
+        bs4_scraper = FrameScraper()
+    else:
+        bs4_scraper = TableScraperBS4()
+    bs4_scraper.scrape_tables(html_content, single_walk=True, parser=parser)
+    if 'bs4' in engines:
+        result['bs4'] = bs4_scraper.get_statistics()
+    if frames:
+        result['frames'] = {}
+        for heading, table in bs4_scraper.heading_index.items():
+            if table is None:
+                continue
+            try:
+                result['frames'][heading] = htmlToDf(table, cache=None, typed=True)
+            except EmptyTableError:
+                continue  # Layout tables without rows
+    return result
+
+
+def scrape_many(documents, engines=('re', 'bs4'), parser='html.parser', frames=False, max_workers=None):
+    """Scrape a batch of HTML documents in a process pool
+    
+    Parsing is pure-Python CPU work, so threads would serialize on the GIL;
+    each document is parsed in a worker process instead.
+    
+    Args:
+        documents (list): HTML strings
+        engines (tuple): Any of 're' and 'bs4'
+        parser (str): BeautifulSoup parser; 'auto' picks best_parser()
+        frames (bool): Also return {heading: DataFrame} per document (dfmodule.typedDf)
+        max_workers (int): Worker processes (default: CPU count); 1 parses in-process
+        
+    Returns:
+        list: One dict per document, in order, with 're'/'bs4' statistics (and 'frames')
+    """
+    documents = list(documents)
+    if parser == 'auto':
+        parser = best_parser()
+    if max_workers == 1 or len(documents) <= 1:
+        return [_scrape_document(html, engines, parser, frames) for html in documents]
+
+    from concurrent.futures import ProcessPoolExecutor  # Pulls in multiprocessing (~15 ms), so only on use
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        count = len(documents)
+        return list(pool.map(_scrape_document, documents, [engines] * count,
+                             [parser] * count, [frames] * count))
+
+
+def compare_scrapers(url, cache=None):
     """Compare RE and BS4 table scrapers
     
     Args:
         url (str): URL to scrape
+        cache (HttpCache): Optional on-disk cache, so repeated runs only revalidate
         
     Returns:
         tuple: Statistics from both scrapers
     """
     # Create file handler and read the webpage
-    file_handler = FileHandler()
+    file_handler = FileHandler(cache=cache)
     html_content = file_handler.read_webpage(url)
     
     if html_content:
@@ -189,10 +709,35 @@ def compare_scrapers(url):
         return None, None
 
 
+def compare_scrapers_many(urls, cache=None, max_workers=None):
+    """compare_scrapers over several URLs: concurrent fetches, parsing in a process pool
+    
+    Args:
+        urls (list): URLs to scrape
+        cache (HttpCache): Optional on-disk cache, so repeated runs only revalidate
+        max_workers (int): Worker processes for parsing
+        
+    Returns:
+        dict: url -> (re_stats, bs4_stats), (None, None) for pages that failed to load
+    """
+    file_handler = FileHandler(cache=cache)
+    try:
+        pages = file_handler.fetch_many(urls)
+    finally:
+        file_handler.close()
+
+    loaded = [url for url, html in pages.items() if html]
+    results = scrape_many([pages[url] for url in loaded], max_workers=max_workers)
+    comparison = {url: (None, None) for url in pages}
+    for url, result in zip(loaded, results):
+        comparison[url] = (result['re'], result['bs4'])
+    return comparison
+
+
 # Example usage
 if __name__ == "__main__":
     url = "https://nssdc.gsfc.nasa.gov/planetary/factsheet"
-    re_stats, bs4_stats = compare_scrapers(url)
+    re_stats, bs4_stats = compare_scrapers(url, cache=HttpCache())
     
     print("Regular Expression Scraper Statistics:")
     print(re_stats)
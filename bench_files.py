@@ -0,0 +1,66 @@
+"""Benchmark Files.filecopy / utilUnzip against copyFiles / unzipParallel
+
+    python bench_files.py [file_count] [file_size_kb]
+"""
+import os
+import sys
+import tempfile
+import time
+import zipfile
+
+import Files
+
+
+def make_files(directory, count, size):
+    paths = []
+    block = (Files.text.encode() * (size // len(Files.text) + 1))[:size]
+    for i in range(count):
+        path = os.path.join(directory, f"file{i}.txt")
+        with open(path, "wb") as f:
+            f.write(block)
+        paths.append(path)
+    return paths
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed * 1000:>9.1f} ms")
+    return elapsed
+
+
+def main(count=200, size_kb=512):
+    with tempfile.TemporaryDirectory() as root:
+        sources = make_files(root, count, size_kb * 1024)
+        print(f"{count} files x {size_kb} KiB")
+
+        serial_dir = os.path.join(root, "serial")
+        batch_dir = os.path.join(root, "batch")
+        os.mkdir(serial_dir)
+        os.mkdir(batch_dir)
+        timed("filecopy (serial shutil.copy)", lambda: [Files.filecopy(path, serial_dir) for path in sources])
+        timed("copyFiles (pool, zero-copy)", Files.copyFiles, [(path, batch_dir) for path in sources])
+
+        archive = os.path.join(root, "bundle.zip")
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            for path in sources:
+                zf.write(path, os.path.basename(path))
+
+        # utilUnzip extracts into the current directory
+        serial_out = os.path.join(root, "unzip_serial")
+        os.mkdir(serial_out)
+        cwd = os.getcwd()
+        os.chdir(serial_out)
+        try:
+            timed("utilUnzip (extractall)", Files.utilUnzip, archive)
+        finally:
+            os.chdir(cwd)
+        timed("unzipParallel (4 workers)", Files.unzipParallel, archive, os.path.join(root, "unzip_parallel"))
+
+        assert sorted(os.listdir(serial_dir)) == sorted(os.listdir(batch_dir))
+        assert sorted(os.listdir(serial_out)) == sorted(os.listdir(os.path.join(root, "unzip_parallel")))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,106 @@
+"""Import-time benchmark for the project modules
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter per
+module and fails if a module pulls in one of the heavy dependencies at import
+or goes over its cumulative import-time budget.
+
+    python bench_imports.py            # report + gate (exit code 1 on regression)
+    python bench_imports.py --baseline # print current medians for BASELINE_MS
+    python -m unittest bench_imports   # same gate as a test
+"""
+import os
+import statistics
+import subprocess
+import sys
+import unittest
+
+# Median cumulative import time of each module itself (interpreter startup
+# excluded), in milliseconds, measured on the reference box. Re-measure with
+# `python bench_imports.py --baseline` after an intended change.
+BASELINE_MS = {
+    "midterm": 34,
+    "sockets": 67,  # asyncio itself is most of this
+    "test_socket": 52,
+    "catalog_store": 2,
+    "catalog_snapshot": 5,
+    "sqlite_executor": 11,
+    "dfmodule": 28,
+    "WebScraper": 21,
+    "exTk": 28,
+    "FileHandler": 20,
+    "Files": 25,
+}
+
+# Budget = baseline * 1.5 + 20 ms. The fixed part absorbs scheduler noise on
+# small modules; an eager pandas/bs4 import still costs hundreds of ms.
+BUDGETS_MS = {module: round(ms * 1.5 + 20) for module, ms in BASELINE_MS.items()}
+
+# Must only be loaded on first use, never by importing a project module
+HEAVY_MODULES = ("pandas", "numpy", "bs4", "requests", "tkinter")
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure(module):
+    """Return (cumulative import time in ms, names of every module imported)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    cumulative_us = None
+    imported = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        imported.append(name)
+        if name == module:
+            cumulative_us = int(cumulative)
+    return cumulative_us / 1000, imported
+
+
+def check(budgets=BUDGETS_MS, runs=5):
+    """Measure every module (median of `runs`) and return a list of regressions"""
+    failures = []
+    print(f"{'module':<18} {'median':>8} {'baseline':>9} {'budget':>8}")
+    for module, budget in budgets.items():
+        samples = [measure(module) for _ in range(runs)]
+        median = statistics.median(ms for ms, _ in samples)
+        imported = samples[0][1]
+        heavy = sorted({name.split(".")[0] for name in imported} & set(HEAVY_MODULES))
+        flag = "" if median <= budget and not heavy else "  <-- REGRESSION"
+        print(f"{module:<18} {median:>8.1f} {BASELINE_MS.get(module, '-'):>9} {budget:>8}{flag}")
+        if median > budget:
+            failures.append(f"{module}: median {median:.1f} ms > {budget} ms budget")
+        if heavy:
+            failures.append(f"{module}: eagerly imports {', '.join(heavy)}")
+    return failures
+
+
+class Tests(unittest.TestCase):
+    def test(self):
+        failures = check()
+        self.assertEqual(failures, [])
+
+
+def baseline(runs=7):
+    """Print a BASELINE_MS dict of the current medians, to paste above"""
+    print("BASELINE_MS = {")
+    for module in BASELINE_MS:
+        median = statistics.median(measure(module)[0] for _ in range(runs))
+        print(f'    "{module}": {round(median)},')
+    print("}")
+
+
+if __name__ == "__main__":
+    if "--baseline" in sys.argv[1:]:
+        baseline()
+        sys.exit(0)
+    failures = check()
+    for failure in failures:
+        print(failure)
+    sys.exit(1 if failures else 0)
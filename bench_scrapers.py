@@ -0,0 +1,156 @@
+"""Offline benchmark suite for the table scrapers on generated HTML
+
+Times every engine (TableScraperRE legacy and single pass, TableScraperBS4
+per installed parser backend, stream_table_rows) on corpora of varying size
+and nesting depth, records peak traced memory, and cross-checks each
+engine's counts against the counts the generator knows it wrote.
+
+    python bench_scrapers.py                   # full suite (exit code 1 on a count mismatch)
+    python bench_scrapers.py [tables] [rows]   # one flat corpus
+"""
+import importlib.util
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+from WebScraper import TABLE_TAGS, TableScraperRE, TableScraperBS4, stream_table_rows
+
+# (name, tables, rows per table, nesting depth)
+CORPORA = [
+    ("small", 10, 20, 0),
+    ("medium", 100, 50, 0),
+    ("large", 200, 60, 0),
+    ("nested", 100, 20, 3),
+]
+
+# The per-tag regexes are known to be approximate: <th[^>]*> also matches
+# <thead>, and the lazy <table>(.*?)</table> stops at a nested table's end tag.
+APPROXIMATE = {"RE (7 regex scans)"}
+
+
+def _table(parts, counts, label, rows, cols, depth):
+    counts.update(table=1, thead=1, tbody=1, tfoot=1, tr=rows + 2, th=cols, td=rows * cols + 1)
+    parts.append(f"<table class='data'><thead><tr>")
+    parts.extend(f"<th>Col {c}</th>" for c in range(cols))
+    parts.append("</tr></thead><tbody>")
+    for r in range(rows):
+        parts.append("<tr>")
+        for c in range(cols):
+            parts.append(f"<td>{label}.{r}.{c}")
+            if depth and r == 0 and c == 0:
+                _table(parts, counts, f"{label}-{r}", 2, 2, depth - 1)
+            parts.append("</td>")
+        parts.append("</tr>")
+    parts.append(f"</tbody><tfoot><tr><td colspan='{cols}'>end {label}</td></tr></tfoot></table>")
+
+
+def make_corpus(tables=200, rows=50, cols=6, depth=0):
+    """Return (html, counts): the page and how many of each TABLE_TAGS tag it holds
+
+    With depth > 0 the first cell of each table nests a 2x2 table, recursively.
+    """
+    counts = Counter({tag: 0 for tag in TABLE_TAGS})
+    parts = ["<html><body>"]
+    for t in range(tables):
+        parts.append(f"<h2>Table {t}</h2>")
+        _table(parts, counts, str(t), rows, cols, depth)
+    parts.append("</body></html>")
+    return "".join(parts), dict(counts)
+
+
+def best_of(func, runs=3):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def peak_memory(func):
+    """Peak bytes allocated by Python while func runs (tracemalloc, so run untimed)"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _re_counts(html, **kwargs):
+    return {tag: len(found) for tag, found in TableScraperRE().scrape_tables(html, **kwargs).items()}
+
+
+def _bs4_stats(html, **kwargs):
+    scraper = TableScraperBS4()
+    scraper.scrape_tables(html, **kwargs)
+    return scraper.get_statistics()
+
+
+def _stream_counts(html, chunk_size=1 << 16):
+    # Only what a row stream can tell: completed rows, and the tables they came from
+    tables = set()
+    rows = 0
+    chunks = (html[i:i + chunk_size] for i in range(0, len(html), chunk_size))
+    for row in stream_table_rows(chunks):
+        tables.add(row.table)
+        rows += 1
+    return {"table": len(tables), "tr": rows}
+
+
+def engines():
+    """(label, func(html) -> counts, timed runs) for every engine available here"""
+    found = [
+        ("RE (7 regex scans)", _re_counts, 3),
+        ("RE (single pass)", lambda html: _re_counts(html, single_pass=True), 3),
+    ]
+    for parser, module in (("html.parser", None), ("lxml", "lxml"), ("html5lib", "html5lib")):
+        if module and importlib.util.find_spec(module) is None:
+            continue
+        found.append((f"BS4 {parser} (7 find_all)", lambda html, p=parser: _bs4_stats(html, parser=p), 1))
+        found.append((f"BS4 {parser} (single walk)",
+                      lambda html, p=parser: _bs4_stats(html, single_walk=True, parser=p), 1))
+    found.append(("Streaming (html.parser)", _stream_counts, 1))
+    return found
+
+
+def run_corpus(name, tables, rows, depth):
+    """Benchmark every engine on one corpus; return the labels whose counts were wrong"""
+    html, expected = make_corpus(tables, rows, depth=depth)
+    print(f"\n{name}: {tables} tables x {rows} rows, depth {depth}, {len(html) / 1e6:.1f} MB")
+    print(f"{'engine':<32} {'ms':>9} {'peak MB':>9}  counts")
+
+    failures = []
+    results = []
+    for label, func, runs in engines():
+        elapsed, counts = best_of(lambda: func(html), runs)
+        peak = peak_memory(lambda: func(html))
+        wrong = sorted(tag for tag, count in counts.items() if count != expected[tag])
+        if not wrong:
+            status = "ok"
+            results.append((elapsed, label))
+        elif label in APPROXIMATE:
+            status = f"approximate ({', '.join(wrong)})"
+        else:
+            status = f"MISMATCH ({', '.join(wrong)})"
+            failures.append(f"{name}: {label} miscounts {', '.join(wrong)}")
+        print(f"{label:<32} {elapsed * 1000:>9.1f} {peak / 1e6:>9.1f}  {status}")
+
+    if results:
+        print(f"fastest exact engine: {min(results)[1]}")
+    return failures
+
+
+def main(tables=None, rows=50):
+    corpora = CORPORA if tables is None else [("custom", tables, rows, 0)]
+    failures = []
+    for corpus in corpora:
+        failures.extend(run_corpus(*corpus))
+    for failure in failures:
+        print(failure)
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main(*[int(arg) for arg in sys.argv[1:3]]) else 0)
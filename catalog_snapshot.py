@@ -0,0 +1,153 @@
+import bisect
+import hashlib
+import mmap
+import os
+import struct
+from typing import Iterator, List, Optional, Tuple
+
+# --------------------------
+# Snapshot layout
+# --------------------------
+# header : magic, sha256 of the source CSVs, record count, reserved
+# records: fixed-width (key, price, name offset, name length), sorted by key
+# names  : UTF-8 product names, addressed by the records
+#
+# The key packs the binary encoding into an integer with a leading 1 bit so
+# encodings of different lengths never collide ('01' -> 0b101, '1' -> 0b11).
+MAGIC = b"CATSNAP1"
+HEADER = struct.Struct("<8s32sII")
+RECORD = struct.Struct("<QdII")
+
+
+def encoding_key(binary_code: str) -> int:
+    return int("1" + binary_code, 2)
+
+
+def key_encoding(key: int) -> str:
+    return bin(key)[3:]
+
+
+def source_digest(*filepaths: str) -> bytes:
+    """sha256 over the contents of the source CSVs, read in 1 MiB blocks"""
+    digest = hashlib.sha256()
+    for path in filepaths:
+        digest.update(os.path.basename(path).encode() + b"\0")
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        digest.update(b"\0")
+    return digest.digest()
+
+
+def write_snapshot(path: str, records: List[dict], digest: bytes):
+    """Write encoded product records (Product.encode_frame layout) to path atomically"""
+    entries = []
+    for record in records:
+        binary = record["Binary Encoding"]
+        if not binary:
+            continue
+        entries.append((encoding_key(binary), float(record["Price"]), record["Product"].encode("utf-8")))
+    # Stable sort keeps the first product for a duplicated code first, matching Product.lookup
+    entries.sort(key=lambda entry: entry[0])
+
+    names = bytearray()
+    body = bytearray()
+    for key, price, name in entries:
+        body += RECORD.pack(key, price, len(names), len(name))
+        names += name
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, digest, len(entries), 0))
+        f.write(body)
+        f.write(names)
+    os.replace(tmp_path, path)
+
+
+class _KeyView:
+    """Sequence view of the sorted record keys, so bisect can search the mapping in place"""
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+
+    def __len__(self):
+        return len(self.snapshot)
+
+    def __getitem__(self, index):
+        return self.snapshot._record(index)[0]
+
+
+# --------------------------
+# CatalogSnapshot Class
+# --------------------------
+class CatalogSnapshot:
+    """Read-only, memory-mapped catalog snapshot with the Product.lookup interface"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, self.digest, self.count, _ = HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC:
+                raise ValueError(f"'{path}' is not a catalog snapshot.")
+            self._names_offset = HEADER.size + self.count * RECORD.size
+            if len(self._mm) < self._names_offset:
+                raise ValueError(f"Catalog snapshot '{path}' is truncated.")
+        except (ValueError, struct.error):
+            self._mm.close()
+            raise
+        self._keys = _KeyView(self)
+
+    def _record(self, index: int) -> Tuple[int, float, int, int]:
+        return RECORD.unpack_from(self._mm, HEADER.size + index * RECORD.size)
+
+    def _name(self, offset: int, length: int) -> str:
+        start = self._names_offset + offset
+        return self._mm[start:start + length].decode("utf-8")
+
+    def lookup(self, binary_code: str) -> Tuple[Optional[str], Optional[float]]:
+        try:
+            key = encoding_key(binary_code)
+        except ValueError:
+            return None, None
+        index = bisect.bisect_left(self._keys, key)
+        if index < self.count:
+            found, price, offset, length = self._record(index)
+            if found == key:
+                return self._name(offset, length), price
+        return None, None
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self) -> Iterator[Tuple[str, float, str]]:
+        for index in range(self.count):
+            key, price, offset, length = self._record(index)
+            yield self._name(offset, length), price, key_encoding(key)
+
+    def close(self):
+        self._mm.close()
+
+
+def load_snapshot(path: str, product_factory, barcode_csv: str = "bc3of9.csv",
+                  products_csv: str = "Products.csv") -> CatalogSnapshot:
+    """Map the snapshot at path, recompiling it first if the source CSVs changed
+
+    product_factory must return a Product (barcode mappings loaded) and is only
+    called when the snapshot is missing or stale.
+    """
+    digest = source_digest(barcode_csv, products_csv)
+    if os.path.exists(path):
+        try:
+            snapshot = CatalogSnapshot(path)
+            if snapshot.digest == digest:
+                return snapshot
+            snapshot.close()
+        except (ValueError, struct.error):
+            pass  # Corrupt or foreign file, recompile below
+
+    import pandas as pd
+    records = product_factory().encode_frame(pd.read_csv(products_csv))
+    write_snapshot(path, records, digest)
+    return CatalogSnapshot(path)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import Optional, Tuple
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+
+CATALOG_COLUMNS = ["Product", "Price", "Encoded Prefix", "Binary Encoding"]
+CATALOG_TYPES = {"Product": "TEXT", "Price": "REAL", "Encoded Prefix": "TEXT", "Binary Encoding": "TEXT"}
+
+# --------------------------
+# CatalogStore Class
+# --------------------------
+class CatalogStore:
+    """Encoded product catalog persisted in an indexed SQLite table.
+
+    Exposes the same lookup(binary_code) interface as Product, so Cart and
+    BarcodeServer can serve from the database instead of an in-memory frame.
+    """
+
+    def __init__(self, db_name: str = "catalog.db", table_name: str = "Catalog"):
+        # Imported here so sqlite_executor's logging setup doesn't pre-empt the
+        # caller's own logging.basicConfig
+        from sqlite_executor import QueryBuilder, CommandExecutor
+
+        self.qb = QueryBuilder(table_name)
+        self.ce = CommandExecutor(db_name, verbose=False)
+        self.table_name = table_name
+        # Statements are built from CATALOG_COLUMNS rather than a template DataFrame, so
+        # opening a populated catalog never loads pandas
+        columns = ", ".join(f'"{col}"' for col in CATALOG_COLUMNS)
+        col_defs = ", ".join(f'"{col}" {CATALOG_TYPES[col]}' for col in CATALOG_COLUMNS)
+        placeholders = ", ".join(["?"] * len(CATALOG_COLUMNS))
+        index_name = f'idx_{table_name}_Binary_Encoding'
+        self._create_query = f'CREATE TABLE IF NOT EXISTS "{table_name}" ({col_defs});'
+        self._index_query = f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "{table_name}" ("Binary Encoding");'
+        self._insert_query = f'INSERT INTO "{table_name}" ({columns}) VALUES ({placeholders});'
+        self._select_query = f'SELECT "Product", "Price" FROM "{table_name}" WHERE "Binary Encoding" = ?;'
+
+    def is_empty(self) -> bool:
+        if not self.ce.table_exists(self.table_name):
+            return True
+        self.ce.cursor.execute(f'SELECT 1 FROM "{self.table_name}" LIMIT 1;')
+        return self.ce.cursor.fetchone() is None
+
+    def reset(self):
+        self.ce.execute(self.qb.query("DROP"))
+        self.ce.execute(self._create_query)
+        self.ce.execute(self._index_query)
+
+    def save_products(self, df_products: pd.DataFrame):
+        """Append an encoded product frame (Product.df_products layout)"""
+        if df_products.empty:
+            return
+        rows = list(df_products[CATALOG_COLUMNS].itertuples(index=False, name=None))
+        self.ce.insert_many(self._insert_query, rows)
+
+    def build_from_csv(self, filepath: str, product_model, chunksize: int = 10000):
+        """Encode Products.csv chunk by chunk, so the source never has to fit in memory"""
+        self.reset()
+        for chunk in pd.read_csv(filepath, chunksize=chunksize):
+            records = product_model.encode_frame(chunk)
+            self.save_products(pd.DataFrame(records, columns=CATALOG_COLUMNS))
+
+    def lookup(self, binary_code: str) -> Tuple[Optional[str], Optional[float]]:
+        # Straight on the cursor: the hot path of every scan, so no per-query logging or commit
+        self.ce.cursor.execute(self._select_query, (binary_code,))
+        row = self.ce.cursor.fetchone()
+        if row is None:
+            return None, None
+        return row[0], row[1]
+
+    def __len__(self):
+        if not self.ce.table_exists(self.table_name):
+            return 0
+        self.ce.cursor.execute(f'SELECT COUNT(*) FROM "{self.table_name}";')
+        return self.ce.cursor.fetchone()[0]
+
+
+def open_catalog(db_name: str, product_factory, products_csv: str = "Products.csv", rebuild: bool = False) -> CatalogStore:
+    """Open the catalog database, encoding products_csv into it only if it is empty
+
+    product_factory is only called (to load the barcode mappings) when the
+    table has to be built, so a populated database starts without touching the CSVs.
+    """
+    store = CatalogStore(db_name)
+    if rebuild or store.is_empty():
+        store.build_from_csv(products_csv, product_factory())
+    return store
@@ -1,10 +1,65 @@
 #from WebScraper import TableScraperBS4/ Made modifications, packaging on full file. 
-import requests 
-from collections import defaultdict
-from bs4 import BeautifulSoup
-import pandas as pd
-import tkinter as tk
-from tkinter import ttk
+import hashlib
+import threading
+from collections import OrderedDict, defaultdict
+from lazy_imports import lazy_import
+from WebScraper import FileHandler, HttpCache, best_parser, collect_table_tags
+
+bs4 = lazy_import("bs4")
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
+# Tk is only loaded once dfdisplay builds a window
+tk = lazy_import("tkinter")
+
+HEADING_TAGS = ('h2', 'h3')
+
+
+class EmptyTableError(Exception):
+    """A <table> with no rows to build a DataFrame from (e.g. a layout table)"""
+
+
+def content_hash(markup):
+    """sha256 hex digest of an HTML string (or bytes)"""
+    if isinstance(markup, str):
+        markup = markup.encode('utf-8', errors='surrogatepass')
+    return hashlib.sha256(markup).hexdigest()
+
+
+class FrameCache:
+    """LRU cache of extracted DataFrames keyed by content hash
+
+    Hits return a copy so callers can mutate their frame without touching the cache.
+    """
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self._cache = OrderedDict()  # key -> DataFrame
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        with self._lock:
+            df = self._cache.get(key)
+            if df is not None:
+                self._cache.move_to_end(key)
+                return df.copy()
+
+        df = build()
+        with self._lock:
+            self._cache[key] = df
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return df.copy()
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self):
+        return len(self._cache)
+
+
+FRAME_CACHE = FrameCache()
 
 class TableScraperBS4: #Taken from prev assignment
     """Class for scraping tables from HTML using BeautifulSoup"""
@@ -12,17 +67,31 @@ class TableScraperBS4: #Taken from prev assignment
     def __init__(self):
         self.table_data = defaultdict(list)
         self.soup = None
+        self.heading_index = {}  # h2/h3 text -> first <table> after it
+        self.content_hash = None
 
-    def scrape_tables(self, html_content):
+    def scrape_tables(self, html_content, single_walk=False, serialize=False, parser='html.parser'):
         """Scrape tables from HTML content using BeautifulSoup
 
         Args:
             html_content (str): HTML content to scrape
+            single_walk (bool): Collect every table tag in one traversal instead of one find_all per tag
+            serialize (bool): With single_walk, store str() of each element instead of
+                the element itself (the per-tag path always stores strings)
+            parser (str): BeautifulSoup parser; 'auto' picks best_parser()
 
         Returns:
             defaultdict: Dictionary with table elements
         """
-        self.soup = BeautifulSoup(html_content, 'html.parser')
+        if parser == 'auto':
+            parser = best_parser()
+        self.soup = bs4.BeautifulSoup(html_content, parser)
+        self.content_hash = content_hash(html_content)
+        self._index_headings()
+
+        if single_walk:
+            self.table_data.update(collect_table_tags(self.soup, serialize))
+            return self.table_data
 
         # Find all table tags
         tables = self.soup.find_all('table')
@@ -55,18 +124,41 @@ class TableScraperBS4: #Taken from prev assignment
 
         return self.table_data
 
+    def _index_headings(self):
+        """Map each h2/h3 text to the next <table> in document order, in one traversal"""
+        self.heading_index = {}
+        pending = []
+        for element in self.soup.find_all(HEADING_TAGS + ('table',)):
+            if element.name == 'table':
+                for text in pending:
+                    self.heading_index.setdefault(text, element)
+                pending = []
+            else:
+                pending.append(element.get_text(strip=True))
+        for text in pending:
+            self.heading_index.setdefault(text, None)  # Heading with no table after it
+
     def get_table_by_heading(self, heading_text):
         """Find a <table> that follows an <h2> with specific text"""
         if not self.soup:
             raise Exception("HTML not yet parsed. Call scrape_tables() first.")
 
-        headings = self.soup.find_all(['h2', 'h3'])
-        for heading in headings:
-            if heading.get_text(strip=True) == heading_text:
-                return heading.find_next("table")
+        if heading_text in self.heading_index:
+            return self.heading_index[heading_text]
 
         raise Exception(f"No table found following heading: {heading_text}")
 
+    def get_df_by_heading(self, heading_text, cache=FRAME_CACHE, typed=False):
+        """htmlToDf of the table after heading_text, memoized by page hash and heading
+
+        Repeated requests for tables of an already-seen page skip both the
+        table lookup and the cell extraction.
+        """
+        if not self.soup:
+            raise Exception("HTML not yet parsed. Call scrape_tables() first.")
+        key = (self.content_hash, heading_text, typed)
+        return cache.get(key, lambda: htmlToDf(self.get_table_by_heading(heading_text), cache=None, typed=typed))
+
     def get_table_count(self):
         """Get the count of tables found
 
@@ -86,7 +178,143 @@ class TableScraperBS4: #Taken from prev assignment
             stats[key] = len(values)
         return stats
 
-def htmlToDf(table_element):
+def _span(cell, attribute):
+    try:
+        return max(1, int(cell.get(attribute, 1)))
+    except (TypeError, ValueError):
+        return 1
+
+def tableGrid(table_element):
+    """Expand a <table> into (header, rows) with colspan/rowspan cells repeated
+
+    The header is the first row when it is all <th> cells, else None. Every
+    row is padded with None to the table's widest row instead of being dropped.
+    """
+    grid = []
+    header = None
+    spans = {}  # column -> [rows still to fill, text] carried down by rowspan
+    # find_all("tr") also reaches into nested tables; keep only the rows this table owns
+    own_rows = [tr for tr in table_element.find_all("tr") if tr.find_parent("table") is table_element]
+    for index, tr in enumerate(own_rows):
+        # Direct children only, so a nested table's cells stay inside its parent cell
+        cells = [child for child in tr.children if child.name in ("td", "th")]
+        if index == 0 and cells and all(cell.name == "th" for cell in cells):
+            header = True
+        row = []
+
+        def carry():
+            while len(row) in spans:
+                span = spans[len(row)]
+                row.append(span[1])
+                span[0] -= 1
+                if span[0] == 0:
+                    del spans[len(row) - 1]
+
+        for cell in cells:
+            carry()
+            text = cell.get_text(strip=True)
+            rowspan = _span(cell, "rowspan")
+            for _ in range(_span(cell, "colspan")):
+                if rowspan > 1:
+                    spans[len(row)] = [rowspan - 1, text]
+                row.append(text)
+        carry()
+        grid.append(row)
+
+    if header:
+        header, grid = grid[0], grid[1:]
+    return header, grid
+
+# A number as scraped tables write it: optional sign and currency sign, digits either
+# plain or in proper thousands groups (1,234,567), optional decimals
+NUMBER_PATTERN = r"(?:-?[$\u20ac\u00a3]?|[$\u20ac\u00a3]-)(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?"
+# Codes with significant leading zeros (zip codes, IDs) stay text: 00501 is not 501
+LEADING_ZERO_PATTERN = r"[-$\u20ac\u00a3]*0\d"
+# float64 round-trips any decimal with at most 15 significant digits
+FLOAT64_DIGITS = 15
+
+def typeColumn(values, categorical_ratio=0.5):
+    """Convert a column of cell strings to the most compact dtype in bulk
+
+    Numeric columns (currency signs and real thousands grouping allowed)
+    become the smallest int/float dtype that holds every value exactly;
+    leading-zero codes, values that don't fit int64 or round-trip through
+    float64, and other text stay text. Repetitive text becomes category, the
+    rest stays object. Empty cells are missing values.
+    """
+    column = pd.Series(values, dtype=object).replace("", None)
+    present = column.dropna().astype(str)
+    if present.empty:
+        return column
+
+    numeric = (present.str.fullmatch(NUMBER_PATTERN).all()
+               and not present.str.match(LEADING_ZERO_PATTERN).any())
+    if numeric:
+        typed = _numericColumn(column, present.str.replace(r"[,$\u20ac\u00a3]", "", regex=True))
+        if typed is not None:
+            return typed
+
+    if column.nunique() <= categorical_ratio * len(present):
+        return column.astype("category")
+    return column
+
+def _numericColumn(column, cleaned):
+    # cleaned: the present cells without grouping or currency signs. None if no exact numeric dtype
+    if not cleaned.str.contains(".", regex=False).any():
+        ints = pd.to_numeric(cleaned)
+        if ints.dtype.kind != "i":
+            return None  # Past int64 (pandas falls back to uint64/float64)
+        if len(cleaned) == len(column):
+            return pd.to_numeric(ints, downcast="integer")
+        if ints.abs().max() > 2 ** 53:
+            return None  # Missing cells need a float column, which can't hold these exactly
+    else:
+        significant = cleaned.str.replace(r"[-.]", "", regex=True).str.strip("0").str.len()
+        if significant.max() > FLOAT64_DIGITS:
+            return None
+
+    numbers = pd.to_numeric(cleaned.reindex(column.index), errors="coerce").astype("float64")
+    compact = pd.to_numeric(numbers, downcast="float")
+    # float32 only when it holds every value exactly; scraped figures often need float64
+    return compact if compact.astype("float64").equals(numbers) else numbers
+
+def typedDf(table_element, categorical_ratio=0.5):
+    """DataFrame of a <table> with colspan/rowspan expanded and typed columns
+
+    Cells are gathered column-wise and each column is converted once with
+    typeColumn, so long tables end up as compact numeric/category columns
+    instead of object strings.
+    """
+    header, grid = tableGrid(table_element)
+    width = max([len(row) for row in grid] + [len(header) if header else 0])
+    if not grid or width == 0:
+        raise EmptyTableError("No valid rows found for DataFrame.")
+
+    if header is None:
+        header = [str(i) for i in range(width)]
+    header = list(header) + [str(i) for i in range(len(header), width)]
+    seen = defaultdict(int)
+    for i, name in enumerate(header):
+        seen[name] += 1
+        if seen[name] > 1:
+            header[i] = f"{name}.{seen[name] - 1}"  # pandas' read_csv style for duplicates
+
+    columns = [[] for _ in range(width)]
+    for row in grid:
+        for i in range(width):
+            columns[i].append(row[i] if i < len(row) else None)
+
+    return pd.DataFrame({name: typeColumn(values, categorical_ratio) for name, values in zip(header, columns)})
+
+def htmlToDf(table_element, cache=FRAME_CACHE, typed=False):
+    # typed=True: typedDf (spans expanded, short rows padded, typed columns) instead of strings
+    # Memoized on the table's markup, so the same table from a re-fetched page is only extracted once
+    if cache is not None:
+        key = (content_hash(str(table_element)), typed)
+        return cache.get(key, lambda: htmlToDf(table_element, cache=None, typed=typed))
+    if typed:
+        return typedDf(table_element)
+
     # Step 1: Extract the first header row (safe for multi-row tables)
     header_row = table_element.find("tr")
     if not header_row:
@@ -112,34 +340,187 @@ def htmlToDf(table_element):
 
     return pd.DataFrame(rows, columns=headers)
 
-def dfdisplay(df): 
-    root = tk.Tk()
-    root.title("States and Capitals")
-
-    frame = ttk.Frame(root)
-    frame.pack(fill=tk.BOTH, expand=True)
-
-    tree = ttk.Treeview(frame, columns=list(df.columns), show='headings')
-    for col in df.columns:
-        tree.heading(col, text=col)
-        tree.column(col, anchor='center')
+def iterTableFrames(rows, table=0, heading=None, batch_size=10000):
+    """Build a table's DataFrame batch by batch from stream_table_rows() output
+
+    The table is picked by heading (text of the h2/h3 before it, as in
+    get_table_by_heading) or else by document-order index. As in htmlToDf, the
+    first row's <th> cells are the columns, later rows keep their <td> cells, and
+    rows with a different number of <td> cells are dropped. A table with no valid
+    rows still yields one empty frame with its columns.
+    """
+    target = None
+    headers = None
+    batch = []
+    yielded = False
+    for row in rows:
+        if target is None:
+            if (heading is not None and row.heading != heading) or (heading is None and row.table != table):
+                continue
+            target = row.table
+        elif row.table != target:
+            continue
 
-    for _, row in df.iterrows():
-        tree.insert("", tk.END, values=list(row))
+        if headers is None:
+            headers = [cell for cell, tag in zip(row.cells, row.tags) if tag == "th"]
+            continue
+        cells = [cell for cell, tag in zip(row.cells, row.tags) if tag == "td"]
+        if len(cells) != len(headers):
+            continue
+        batch.append(cells)
+        if len(batch) >= batch_size:
+            yield pd.DataFrame(batch, columns=headers)
+            yielded = True
+            batch = []
+    if batch or (target is not None and not yielded):
+        yield pd.DataFrame(batch, columns=headers)
+
+def streamToDf(rows, table=0, heading=None, batch_size=10000):
+    # htmlToDf without a DOM: only the current batch of rows is held as Python lists
+    frames = list(iterTableFrames(rows, table, heading, batch_size))
+    if not frames:
+        raise Exception("No matching table with rows found.")
+    return pd.concat(frames, ignore_index=True)
+
+class DataFrameView:
+    """Treeview over a DataFrame that only materializes the visible rows
+
+    Sorting and filtering happen on the DataFrame (a stable sort and a
+    vectorized substring mask) and produce an array of row positions; scrolling
+    re-renders the `height` rows at the current offset, so opening, sorting or
+    filtering a million-row frame costs the same in the widget as ten rows.
+    Click a heading to sort by it (again to reverse); type in the filter box to
+    keep rows where any column contains the text.
+    """
+
+    def __init__(self, master, df, height=25):
+        from tkinter import ttk
+
+        self.df = df.reset_index(drop=True)
+        self.rows = height
+        self.top = 0
+        self.positions = np.arange(len(self.df))  # Rows in view order, after sort and filter
+        self._order = None  # Sorted positions of the whole frame
+        self._mask = None  # Filter mask over the whole frame
+        self._sort = None  # (column, ascending)
+        self._text = {}  # column -> lowercased str column, built on first filter
+        self._filter_job = None
+
+        self.frame = ttk.Frame(master)
+        bar = ttk.Frame(self.frame)
+        bar.pack(side=tk.TOP, fill=tk.X)
+        ttk.Label(bar, text="Filter:").pack(side=tk.LEFT)
+        self.filter_var = tk.StringVar()
+        entry = ttk.Entry(bar, textvariable=self.filter_var)
+        entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        entry.bind('<KeyRelease>', self._schedule_filter)
+        self.status = ttk.Label(bar)
+        self.status.pack(side=tk.RIGHT)
+
+        columns = [str(col) for col in self.df.columns]
+        self.tree = ttk.Treeview(self.frame, columns=columns, show='headings', height=height)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+        for name, col in zip(columns, self.df.columns):
+            self.tree.heading(name, text=name, command=lambda c=col: self.sort_by(c))
+            self.tree.column(name, anchor='center')
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree.bind('<MouseWheel>', lambda e: self.scroll(-3 if e.delta > 0 else 3))
+        self.tree.bind('<Button-4>', lambda e: self.scroll(-3))  # X11 wheel
+        self.tree.bind('<Button-5>', lambda e: self.scroll(3))
+        self.tree.bind('<Prior>', lambda e: self.scroll(-self.rows))
+        self.tree.bind('<Next>', lambda e: self.scroll(self.rows))
+        self._render()
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def sort_by(self, column):
+        ascending = not (self._sort and self._sort == (column, True))
+        self._sort = (column, ascending)
+        ordered = self.df[column].sort_values(kind='stable', ascending=ascending, na_position='last')
+        self._order = ordered.index.to_numpy()
+        self._update_positions()
+
+    def filter(self, text):
+        text = text.strip().lower()
+        if not text:
+            self._mask = None
+        else:
+            mask = np.zeros(len(self.df), dtype=bool)
+            for column in self.df.columns:
+                if column not in self._text:
+                    self._text[column] = self.df[column].astype(str).str.lower()
+                mask |= self._text[column].str.contains(text, regex=False).to_numpy(dtype=bool)
+            self._mask = mask
+        self._update_positions()
+
+    def scroll(self, delta):
+        self.scroll_to(self.top + delta)
+        return "break"
+
+    def scroll_to(self, top):
+        top = max(0, min(int(top), len(self.positions) - self.rows))
+        if top != self.top:
+            self.top = top
+            self._render()
+
+    def _update_positions(self):
+        positions = self._order if self._order is not None else np.arange(len(self.df))
+        if self._mask is not None:
+            positions = positions[self._mask[positions]]
+        self.positions = positions
+        self.top = 0
+        self._render()
+
+    def _schedule_filter(self, event=None):
+        # Debounced, so typing a word filters once rather than per keystroke
+        if self._filter_job is not None:
+            self.tree.after_cancel(self._filter_job)
+        self._filter_job = self.tree.after(200, self._apply_filter)
+
+    def _apply_filter(self):
+        self._filter_job = None
+        self.filter(self.filter_var.get())
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.scroll_to(float(amount) * len(self.positions))
+        elif action == 'scroll':
+            step = self.rows if unit == 'pages' else 1
+            self.scroll(int(amount) * step)
+
+    def _render(self):
+        self.tree.delete(*self.tree.get_children())
+        window = self.df.iloc[self.positions[self.top:self.top + self.rows]]
+        for values in window.itertuples(index=False, name=None):
+            self.tree.insert("", tk.END, values=["" if pd.isna(v) else v for v in values])
+
+        total = len(self.positions)
+        if total <= self.rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.top / total, (self.top + self.rows) / total)
+        self.status.config(text=f"{total:,} of {len(self.df):,} rows")
+
+
+def dfdisplay(df, title="States and Capitals"):
+    root = tk.Tk()
+    root.title(title)
 
-    tree.pack(fill=tk.BOTH, expand=True)
+    view = DataFrameView(root, df)
+    view.pack(fill=tk.BOTH, expand=True)
     root.mainloop()
 
 
 if __name__ == "__main__":
     url = "https://thefactfile.org/u-s-states-and-capitals/"
-    response = requests.get(url)
+    html_content = FileHandler(cache=HttpCache()).read_webpage(url)
 
     scraper = TableScraperBS4()
-    scraper.scrape_tables(response.content)
-    table = scraper.get_table_by_heading("50 States And Their Capitals")
-
-    df = htmlToDf(table)
+    scraper.scrape_tables(html_content)
+    df = scraper.get_df_by_heading("50 States And Their Capitals")
     dfdisplay(df)
 
 
@@ -1,39 +1,147 @@
 import os
-import tkinter as tk
-from tkinter import messagebox, scrolledtext
+import codecs
+import mmap
+import queue
+import threading
+import time
+import unittest
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from lazy_imports import lazy_import
+from Files import scanEntries
+
+# Tk is only loaded once a window is built; the managers work headless
+tk = lazy_import("tkinter")
+
+class DirectoryCache:
+    """LRU cache of scanEntries() results keyed by path, dropped when the directory mtime changes"""
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self._cache = OrderedDict()  # path -> (st_mtime_ns, entries)
+        self._lock = threading.Lock()  # Filled from FileBrowserApp's listing thread
+
+    def get(self, path):
+        path = os.path.abspath(path)
+        mtime = os.stat(path).st_mtime_ns  # Taken before scanning, so a change mid-scan shows up next time
+        with self._lock:
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                self._cache.move_to_end(path)
+                return cached[1]
+
+        entries = scanEntries(path)
+        with self._lock:
+            self._cache[path] = (mtime, entries)
+            self._cache.move_to_end(path)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return entries
+
+    def invalidate(self, path=None):
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(os.path.abspath(path), None)
+
 
 class DirectoryManager:
-    def __init__(self, path="."):
+    def __init__(self, path=".", entries=None):
+        # entries: a scanEntries() result to share one directory scan with FileManager
         self.path = os.path.abspath(path)
-        self.directories = [d for d in os.listdir(self.path) if os.path.isdir(os.path.join(self.path, d))]
+        if entries is None:
+            entries = scanEntries(self.path)
+        self.directories = [e.name for e in entries if e.is_dir]
 
     def __iter__(self):
         return iter(self.directories)
 
 
+class ContentClassifier:
+    """Sorts files into 'text', 'binary' or 'unreadable' from a sampled prefix
+
+    Results are cached by (device, inode, size, mtime), so a file is only read
+    again once it changes. classify_many spreads cache misses over a thread pool.
+    """
+
+    def __init__(self, sample_size=1024, workers=8, maxsize=16384):
+        self.sample_size = sample_size
+        self.workers = workers
+        self.maxsize = maxsize
+        self._cache = OrderedDict()  # (st_dev, st_ino, st_size, st_mtime_ns) -> kind
+        self._lock = threading.Lock()
+        self._pool = None
+
+    def _key(self, filepath):
+        st = os.stat(filepath)
+        return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _sample(self, filepath):
+        try:
+            with open(filepath, 'rb') as file:
+                chunk = file.read(self.sample_size)
+        except OSError:
+            return 'unreadable'
+        if b'\0' in chunk:
+            return 'binary'
+        try:
+            # final=False: a multi-byte character cut off by the sample boundary is still valid text
+            codecs.getincrementaldecoder('utf-8')().decode(chunk, final=False)
+            return 'text'
+        except UnicodeDecodeError:
+            return 'binary'
+
+    def classify(self, filepath):
+        try:
+            key = self._key(filepath)
+        except OSError:
+            return 'unreadable'
+        with self._lock:
+            kind = self._cache.get(key)
+            if kind is not None:
+                self._cache.move_to_end(key)
+                return kind
+        kind = self._sample(filepath)
+        if kind != 'unreadable':  # Permissions can change without touching mtime
+            with self._lock:
+                self._cache[key] = kind
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+        return kind
+
+    def classify_many(self, filepaths):
+        """Return {filepath: kind}, sampling uncached files in parallel"""
+        with self._lock:  # Called from several listing threads; build one pool
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        return dict(zip(filepaths, self._pool.map(self.classify, filepaths)))
+
+
+# Shared by FileHandler, FileManager and the browser's type badges
+CLASSIFIER = ContentClassifier()
+
+
 class FileHandler:
     def __init__(self, filepath):
         self.filepath = filepath
 
+    def content_type(self):
+        return CLASSIFIER.classify(self.filepath)
+
     def is_binary(self):
-        try:
-            with open(self.filepath, 'rb') as file:
-                chunk = file.read(1024)
-                if b'\0' in chunk:
-                    return True
-                try:
-                    chunk.decode('utf-8')
-                    return False
-                except UnicodeDecodeError:
-                    return True
-        except Exception:
-            return True  # Treat as binary if any issue occurs
+        return self.content_type() != 'text'  # Unreadable files can't be shown as text either
 
 
 class FileManager:
-    def __init__(self, path="."):
+    PAGED_VIEW_THRESHOLD = 1 << 20  # Files above 1 MiB open in PagedTextWindow
+
+    def __init__(self, path=".", entries=None):
         self.path = os.path.abspath(path)
-        self.files = [f for f in os.listdir(self.path) if os.path.isfile(os.path.join(self.path, f))]
+        if entries is None:
+            entries = scanEntries(self.path)
+        self.files = [e.name for e in entries if e.is_file]
 
     def __iter__(self):
         return iter(self.files)
@@ -43,10 +151,16 @@ class FileManager:
         if not os.path.isfile(filepath):
             raise FileNotFoundError(f"File '{filename}' not found.")
 
-        handler = FileHandler(filepath)
-        if handler.is_binary():
+        kind = FileHandler(filepath).content_type()
+        if kind == 'unreadable':
+            raise PermissionError(f"Cannot read file: {filename}")
+        if kind == 'binary':
             raise ValueError(f"Cannot open binary file: {filename}")
 
+        if os.path.getsize(filepath) > self.PAGED_VIEW_THRESHOLD:
+            PagedTextWindow(title=filename, filepath=filepath)
+            return
+
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
         ScrollableTextWindow(title=filename, text_content=content)
@@ -54,6 +168,8 @@ class FileManager:
 
 class ScrollableTextWindow:
     def __init__(self, title, text_content):
+        from tkinter import scrolledtext
+
         self.window = tk.Toplevel()
         self.window.title(title)
         text_area = scrolledtext.ScrolledText(self.window, wrap=tk.WORD, width=80, height=30)
@@ -62,49 +178,440 @@ class ScrollableTextWindow:
         text_area.config(state='disabled')
 
 
+class LineIndex:
+    """Byte offset of every line start in a memory-mapped file, built on a background thread
+
+    Lines are usable as soon as they are indexed; `done` flips once the whole file is scanned.
+    """
+
+    def __init__(self, mm):
+        self.mm = mm
+        self.size = len(mm) if mm is not None else 0
+        self.offsets = array('Q', [0])
+        self.done = mm is None
+        if not self.done:
+            threading.Thread(target=self._build, daemon=True).start()
+
+    def _build(self):
+        pos = 0
+        batch = array('Q')
+        while True:
+            newline = self.mm.find(b'\n', pos)
+            if newline == -1 or newline + 1 >= self.size:
+                break
+            pos = newline + 1
+            batch.append(pos)
+            if len(batch) >= 65536:
+                self.offsets.extend(batch)
+                batch = array('Q')
+        self.offsets.extend(batch)
+        self.done = True
+
+    def __len__(self):
+        # The last indexed line's end is only known once the scan has passed it
+        if self.size == 0:
+            return 0
+        return len(self.offsets) if self.done else len(self.offsets) - 1
+
+    def read_lines(self, start, stop):
+        stop = min(stop, len(self))
+        if start >= stop:
+            return []
+        begin = self.offsets[start]
+        end = self.offsets[stop] if stop < len(self.offsets) else self.size
+        raw = self.mm[begin:end]
+        return [line.rstrip(b'\r').decode('utf-8', errors='replace') for line in raw.split(b'\n')[:stop - start]]
+
+
+class PagedTextWindow:
+    """Read-only viewer for large text files
+
+    The file is memory-mapped and indexed by LineIndex in the background; only the
+    lines in the viewport are decoded and put in the Text widget, from an LRU of pages.
+    """
+    PAGE_LINES = 256
+    MAX_PAGES = 16
+    POLL_MS = 100
+
+    def __init__(self, title, filepath, width=100, height=30):
+        self.title = title
+        self.window = tk.Toplevel()
+        self.window.title(title)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.text = tk.Text(self.window, wrap=tk.NONE, width=width, height=height)
+        self.scrollbar = tk.Scrollbar(self.window, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text.pack(side=tk.LEFT, expand=True, fill='both')
+        self.text.bind('<MouseWheel>', lambda e: self.scroll(-3 if e.delta > 0 else 3))
+        self.text.bind('<Button-4>', lambda e: self.scroll(-3))
+        self.text.bind('<Button-5>', lambda e: self.scroll(3))
+        self.text.bind('<Prior>', lambda e: self.scroll(-self.rows))
+        self.text.bind('<Next>', lambda e: self.scroll(self.rows))
+
+        self._file = open(filepath, 'rb')
+        mm = None
+        if os.fstat(self._file.fileno()).st_size:
+            mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.index = LineIndex(mm)
+        self.rows = height
+        self.top = 0
+        self._pages = OrderedDict()  # page number -> decoded lines
+
+        self._render()
+        if not self.index.done:
+            self.window.after(self.POLL_MS, self._poll_index)
+
+    def _page(self, number):
+        page = self._pages.get(number)
+        if page is not None:
+            self._pages.move_to_end(number)
+            return page
+        start = number * self.PAGE_LINES
+        page = self.index.read_lines(start, start + self.PAGE_LINES)
+        if len(page) == self.PAGE_LINES or self.index.done:  # Don't cache a page the index hasn't finished
+            self._pages[number] = page
+            while len(self._pages) > self.MAX_PAGES:
+                self._pages.popitem(last=False)
+        return page
+
+    def visible_lines(self):
+        lines = []
+        first, last = self.top // self.PAGE_LINES, (self.top + self.rows - 1) // self.PAGE_LINES
+        for number in range(first, last + 1):
+            lines.extend(self._page(number))
+        offset = self.top - first * self.PAGE_LINES
+        return lines[offset:offset + self.rows]
+
+    def scroll(self, delta):
+        self.scroll_to(self.top + delta)
+        return "break"
+
+    def scroll_to(self, top):
+        top = max(0, min(int(top), len(self.index) - self.rows))
+        if top != self.top:
+            self.top = top
+            self._render()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.scroll_to(float(amount) * len(self.index))
+        elif action == 'scroll':
+            step = self.rows if unit == 'pages' else 1
+            self.scroll(int(amount) * step)
+
+    def _render(self):
+        self.text.config(state='normal')
+        self.text.delete('1.0', tk.END)
+        lines = self.visible_lines()
+        self._shown = len(lines)
+        self.text.insert(tk.END, "\n".join(lines))
+        self.text.config(state='disabled')
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        total = len(self.index)
+        if total <= self.rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.top / total, (self.top + self.rows) / total)
+
+    def _poll_index(self):
+        if not self.window.winfo_exists():
+            return
+        if self._shown < self.rows:
+            self._render()  # Viewport not full yet, fill it in as lines get indexed
+        else:
+            self._update_scrollbar()
+        if self.index.done:
+            self.window.title(self.title)
+        else:
+            self.window.title(f"{self.title} (indexing... {len(self.index)} lines)")
+            self.window.after(self.POLL_MS, self._poll_index)
+
+    def close(self):
+        self.window.destroy()
+        self._file.close()  # The mmap stays valid for the index thread until it is collected
+
+
+class VirtualListbox:
+    """Listbox that only materializes the rows in view; the full list lives in self.items
+
+    The scrollbar is driven by the length of self.items, and scrolling re-renders
+    the visible window, so the widget costs the same at 100 or 100k entries.
+    """
+
+    def __init__(self, master, width=50, height=10, format_item=str):
+        self.format_item = format_item  # Display text for an item; get_selected() still returns the item
+        self.frame = tk.Frame(master)
+        self.listbox = tk.Listbox(self.frame, width=width, height=height, exportselection=False)
+        self.scrollbar = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.items = []
+        self.rows = height
+        self.top = 0
+        self.selected = None  # Index into self.items
+        self._on_select = None
+
+        self.listbox.bind('<<ListboxSelect>>', self._handle_select)
+        self.listbox.bind('<MouseWheel>', lambda e: self.scroll(-3 if e.delta > 0 else 3))
+        self.listbox.bind('<Button-4>', lambda e: self.scroll(-3))  # X11 wheel
+        self.listbox.bind('<Button-5>', lambda e: self.scroll(3))
+        self.listbox.bind('<Up>', lambda e: self._step(-1))
+        self.listbox.bind('<Down>', lambda e: self._step(1))
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def bind_select(self, callback):
+        self._on_select = callback
+
+    def clear(self):
+        self.items = []
+        self.top = 0
+        self.selected = None
+        self._render()
+
+    def extend(self, items):
+        old_len = len(self.items)
+        self.items.extend(items)
+        if old_len < self.top + self.rows:
+            self._render()  # New rows are in view
+        else:
+            self._update_scrollbar()
+
+    def refresh(self):
+        self._render()
+
+    def get_selected(self):
+        if self.selected is None or self.selected >= len(self.items):
+            return None
+        return self.items[self.selected]
+
+    def scroll(self, delta):
+        self.scroll_to(self.top + delta)
+        return "break"
+
+    def scroll_to(self, top):
+        top = max(0, min(int(top), len(self.items) - self.rows))
+        if top != self.top:
+            self.top = top
+            self._render()
+
+    def _step(self, delta):
+        if not self.items:
+            return "break"
+        index = 0 if self.selected is None else max(0, min(self.selected + delta, len(self.items) - 1))
+        if index < self.top:
+            self.scroll_to(index)
+        elif index >= self.top + self.rows:
+            self.scroll_to(index - self.rows + 1)
+        self._select(index)
+        return "break"
+
+    def _select(self, index):
+        self.selected = index
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(index - self.top)
+        if self._on_select:
+            self._on_select(None)
+
+    def _handle_select(self, event):
+        selection = self.listbox.curselection()
+        if selection:
+            self.selected = self.top + selection[0]
+            if self._on_select:
+                self._on_select(event)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.scroll_to(float(amount) * len(self.items))
+        elif action == 'scroll':
+            step = self.rows if unit == 'pages' else 1
+            self.scroll(int(amount) * step)
+
+    def _render(self):
+        self.listbox.delete(0, tk.END)
+        visible = self.items[self.top:self.top + self.rows]
+        if visible:
+            self.listbox.insert(tk.END, *[self.format_item(item) for item in visible])
+        if self.selected is not None and self.top <= self.selected < self.top + len(visible):
+            self.listbox.selection_set(self.selected - self.top)
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        total = len(self.items)
+        if total <= self.rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.top / total, (self.top + self.rows) / total)
+
+
 class FileBrowserApp:
+    BATCH_SIZE = 1000  # Names handed to the Tk thread per queue message
+    POLL_MS = 20       # How often the Tk loop drains the listing queue
+    MAX_BATCHES_PER_POLL = 20
+
     def __init__(self, root, start_path="."):
+        from tkinter import messagebox
+
+        self.messagebox = messagebox
         self.root = root
         self.root.title("Simple File Browser")
         self.current_path = os.path.abspath(start_path)
+        self.dir_cache = DirectoryCache()
+        self.file_manager = None
+        self.file_types = {}  # filename -> 'text' / 'binary' / 'unreadable', filled in after listing
+        self._results = queue.Queue()
+        self._generation = 0  # Bumped per refresh; batches from older listings are dropped
+        self._polling = False
 
-        self.dir_listbox = tk.Listbox(root, width=50)
+        self.dir_listbox = VirtualListbox(root, width=50)
         self.dir_listbox.pack(padx=10, pady=5)
-        self.dir_listbox.bind('<<ListboxSelect>>', self.change_directory)
+        self.dir_listbox.bind_select(self.change_directory)
 
-        self.file_listbox = tk.Listbox(root, width=50)
+        self.file_listbox = VirtualListbox(root, width=50, format_item=self._file_label)
         self.file_listbox.pack(padx=10, pady=5)
-        self.file_listbox.bind('<<ListboxSelect>>', self.open_file)
+        self.file_listbox.bind_select(self.open_file)
 
         self.refresh_lists()
 
     def refresh_lists(self):
-        self.dir_listbox.delete(0, tk.END)
-        self.file_listbox.delete(0, tk.END)
+        # Listing runs on a worker thread; _poll feeds the results to the listboxes in batches
+        self.dir_listbox.clear()
+        self.file_listbox.clear()
+        self.file_manager = None
+        self.file_types = {}
+        self._generation += 1
+        threading.Thread(target=self._list_directory, args=(self._generation, self.current_path), daemon=True).start()
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.POLL_MS, self._poll)
+
+    def _list_directory(self, generation, path):
         try:
-            for d in DirectoryManager(self.current_path):
-                self.dir_listbox.insert(tk.END, d)
-            for f in FileManager(self.current_path):
-                self.file_listbox.insert(tk.END, f)
+            entries = self.dir_cache.get(path)
+            file_manager = FileManager(path, entries)
+            directories = DirectoryManager(path, entries).directories
+            self._results.put((generation, 'manager', file_manager))
+            for i in range(0, len(directories), self.BATCH_SIZE):
+                self._results.put((generation, 'dirs', directories[i:i + self.BATCH_SIZE]))
+            for i in range(0, len(file_manager.files), self.BATCH_SIZE):
+                self._results.put((generation, 'files', file_manager.files[i:i + self.BATCH_SIZE]))
+            # Type badges after all names are out, so the listing shows up first
+            for i in range(0, len(file_manager.files), self.BATCH_SIZE):
+                if generation != self._generation:
+                    break  # Navigated away
+                names = file_manager.files[i:i + self.BATCH_SIZE]
+                kinds = CLASSIFIER.classify_many([os.path.join(path, name) for name in names])
+                self._results.put((generation, 'types', {name: kinds[os.path.join(path, name)] for name in names}))
         except Exception as e:
-            messagebox.showerror("Error", str(e))
+            self._results.put((generation, 'error', str(e)))
+        self._results.put((generation, 'done', None))
+
+    def _poll(self):
+        finished = False
+        for _ in range(self.MAX_BATCHES_PER_POLL):
+            try:
+                generation, kind, payload = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self._generation:
+                continue
+            if kind == 'manager':
+                self.file_manager = payload
+            elif kind == 'dirs':
+                self.dir_listbox.extend(payload)
+            elif kind == 'files':
+                self.file_listbox.extend(payload)
+            elif kind == 'types':
+                self.file_types.update(payload)
+                self.file_listbox.refresh()
+            elif kind == 'error':
+                self.messagebox.showerror("Error", payload)
+            elif kind == 'done':
+                finished = True
+        if finished and self._results.empty():
+            self._polling = False
+        else:
+            self.root.after(self.POLL_MS, self._poll)
+
+    def _file_label(self, name):
+        kind = self.file_types.get(name)
+        return f"{name}  [{kind}]" if kind else name
 
     def change_directory(self, event):
-        selection = self.dir_listbox.curselection()
-        if selection:
-            selected_dir = self.dir_listbox.get(selection[0])
+        selected_dir = self.dir_listbox.get_selected()
+        if selected_dir is not None:
             self.current_path = os.path.join(self.current_path, selected_dir)
             self.refresh_lists()
 
     def open_file(self, event):
-        selection = self.file_listbox.curselection()
-        if selection:
-            selected_file = self.file_listbox.get(selection[0])
+        selected_file = self.file_listbox.get_selected()
+        if selected_file is not None:
             try:
-                fm = FileManager(self.current_path)
+                # Reuse the listing refresh_lists built instead of scanning the directory again
+                fm = self.file_manager or FileManager(self.current_path, self.dir_cache.get(self.current_path))
                 fm.open_file(selected_file)
             except Exception as e:
-                messagebox.showerror("Error", str(e))
+                self.messagebox.showerror("Error", str(e))
+
+
+class Tests(unittest.TestCase):
+    def setUp(self):
+        import shutil
+        import tempfile
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def write(self, name, data):
+        path = os.path.join(self.dir, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_classify(self):
+        classifier = ContentClassifier(sample_size=4)
+        text = self.write("a.txt", "h\u00e9llo".encode())  # Sample ends inside the two-byte \u00e9
+        binary = self.write("b.bin", b"ab\0c")
+        missing = os.path.join(self.dir, "missing")
+        self.assertEqual(classifier.classify_many([text, binary, missing, self.dir]),
+                         {text: 'text', binary: 'binary', missing: 'unreadable', self.dir: 'unreadable'})
+
+        # Same size and mtime: the cached kind stands; a new mtime drops it
+        st = os.stat(text)
+        self.write("a.txt", b"\0" * st.st_size)
+        os.utime(text, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertEqual(classifier.classify(text), 'text')
+        os.utime(text, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        self.assertEqual(classifier.classify(text), 'binary')
+
+    def test_directory_cache(self):
+        cache = DirectoryCache()
+        first = cache.get(self.dir)
+        self.assertIs(cache.get(self.dir), first)  # No rescan while the mtime holds
+        st = os.stat(self.dir)
+        self.write("new.txt", b"")
+        os.utime(self.dir, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        second = cache.get(self.dir)
+        self.assertIsNot(second, first)
+        self.assertEqual([entry.name for entry in second], ["new.txt"])
+        self.assertIs(cache.get(self.dir), second)
+
+    def test_line_index(self):
+        for data in (b"one\ntwo\nthree\n", b"one\ntwo\nthree", b"one\r\ntwo\r\nthree\r\n", b"one\r\ntwo\r\nthree"):
+            with open(self.write("lines.txt", data), 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                index = LineIndex(mm)
+                deadline = time.monotonic() + 5
+                while not index.done and time.monotonic() < deadline:
+                    time.sleep(0.001)
+                self.assertEqual(len(index), 3, data)
+                self.assertEqual(index.read_lines(0, 10), ["one", "two", "three"], data)
+                self.assertEqual(index.read_lines(1, 2), ["two"], data)
+        self.assertEqual(len(LineIndex(None)), 0)
 
 
 if __name__ == "__main__":
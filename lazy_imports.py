@@ -0,0 +1,21 @@
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """Return module `name` without executing it until the first attribute access
+
+    Keeps heavy dependencies (pandas, bs4, requests, tkinter) off the import
+    path of modules that only need them in some code paths.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -1,5 +1,10 @@
-import pandas as pd
 from collections import namedtuple
+from lazy_imports import lazy_import
+from catalog_store import open_catalog
+from catalog_snapshot import load_snapshot
+from FileHandler import FileHandler
+
+pd = lazy_import("pandas")
 
 # --------------------------
 # BarcodeData Class
@@ -47,6 +52,9 @@ class Product:
 
     def load_products(self, filepath: str):
         df_raw = pd.read_csv(filepath)
+        self.df_products = pd.DataFrame(self.encode_frame(df_raw))
+
+    def encode_frame(self, df_raw):
         product_records = []
 
         for _, row in df_raw.iterrows():
@@ -72,7 +80,14 @@ class Product:
                 print(f"Skipping '{name}': {e}")
                 continue
 
-        self.df_products = pd.DataFrame(product_records)
+        return product_records
+
+    def lookup(self, binary_code):
+        df = self.df_products
+        match = df[df["Binary Encoding"] == binary_code]
+        if not match.empty:
+            return match.iloc[0]["Product"], match.iloc[0]["Price"]
+        return None, None
 
 
 # --------------------------
@@ -90,35 +105,53 @@ class Cart:
         raw_carts = [cart.strip() for cart in raw_data.split('---CART BREAK---') if cart.strip()]
         self.carts = [cart.split(',') for cart in raw_carts]
 
+    def iter_carts(self, filepath: str, chunk_size=1 << 16):
+        # Yields one cart at a time, so the cart file never has to fit in memory
+        return self.split_carts(FileHandler(filepath, 't').read_chunks(chunk_size))
+
+    def split_carts(self, chunks):
+        # Carts from any stream of text chunks, e.g. Files.iterZipMember("bundle.zip", "Carts.csv")
+        pending = ''
+        for chunk in chunks:
+            pending += chunk
+            *complete, pending = pending.split('---CART BREAK---')
+            for cart in complete:
+                cart = cart.strip()
+                if cart:
+                    yield cart.split(',')
+        pending = pending.strip()
+        if pending:
+            yield pending.split(',')
+
     def decode_product(self, binary_code):
-        df = self.product_model.df_products
-        match = df[df["Binary Encoding"] == binary_code]
-        if not match.empty:
-            return match.iloc[0]["Product"], match.iloc[0]["Price"]
-        return None, None
+        # product_model is a Product or a CatalogStore; both expose lookup()
+        return self.product_model.lookup(binary_code)
+
+    def format_receipt(self, idx, cart):
+        lines = [f"Cart {idx}:\n{'-' * 40}"]
+        total = 0.0
+
+        for binary in cart:
+            binary = binary.strip()
+            if not binary or len(binary) != 45:
+                continue
+
+            name, price = self.decode_product(binary)
+            if name:
+                lines.append(f"{name:<24} ${price:>6.2f}")
+                total += price
+            else:
+                lines.append(f"[Unknown Product]       ${0.00:>6.2f}")
+                lines.append(f"(Unrecognized code: {binary})")
+
+        lines.append(f"{'-' * 40}")
+        lines.append(f"{'Total Price:':<24} ${total:>6.2f}\n")
+        return "\n".join(lines)
 
     def generate_receipts(self):
         self.receipts = []  # Clear any previous receipts
         for idx, cart in enumerate(self.carts, start=1):
-            lines = [f"Cart {idx}:\n{'-' * 40}"]
-            total = 0.0
-
-            for binary in cart:
-                binary = binary.strip()
-                if not binary or len(binary) != 45:
-                    continue
-
-                name, price = self.decode_product(binary)
-                if name:
-                    lines.append(f"{name:<24} ${price:>6.2f}")
-                    total += price
-                else:
-                    lines.append(f"[Unknown Product]       ${0.00:>6.2f}")
-                    lines.append(f"(Unrecognized code: {binary})")
-
-            lines.append(f"{'-' * 40}")
-            lines.append(f"{'Total Price:':<24} ${total:>6.2f}\n")
-            self.receipts.append("\n".join(lines))
+            self.receipts.append(self.format_receipt(idx, cart))
 
     def print_receipts(self):
         for receipt in self.receipts:
@@ -129,18 +162,37 @@ class Cart:
             for receipt in self.receipts:
                 f.write(receipt + '\n')
 
+    def stream_receipts(self, carts_path, receipts_path):
+        # Same output as load_carts + generate_receipts + save_receipts, one cart in memory at a time
+        with FileHandler(receipts_path).stream_writer(append=False) as writer:
+            for idx, cart in enumerate(self.iter_carts(carts_path), start=1):
+                writer.write(self.format_receipt(idx, cart) + '\n')
+
 
 # --------------------------
 # Runtime Entry Point
 # --------------------------
-def main():
-    # Step 1: Load barcode definitions
+def load_encoder():
     barcode_data = BarcodeData()
     barcode_data.load_csv("bc3of9.csv")
-
-    # Step 2: Load and encode products
-    product_data = Product(barcode_data)
-    product_data.load_products("Products.csv")
+    return Product(barcode_data)
+
+
+def main(catalog_db=None, snapshot=None):
+    if snapshot:
+        # Steps 1-2 from the compiled snapshot, recompiled only when the CSVs change
+        product_data = load_snapshot(snapshot, load_encoder)
+    elif catalog_db:
+        # Steps 1-2 against SQLite: the CSVs are only encoded on the first run
+        product_data = open_catalog(catalog_db, load_encoder)
+    else:
+        # Step 1: Load barcode definitions
+        barcode_data = BarcodeData()
+        barcode_data.load_csv("bc3of9.csv")
+
+        # Step 2: Load and encode products
+        product_data = Product(barcode_data)
+        product_data.load_products("Products.csv")
 
     # Step 3: Load carts and generate receipts
     cart = Cart(product_data)
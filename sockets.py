@@ -2,11 +2,20 @@ from collections import namedtuple
 import asyncio
 import json
 import logging
+import time
 from queue import Queue
-import pandas as pd
+from lazy_imports import lazy_import
+from catalog_store import open_catalog
+from catalog_snapshot import load_snapshot
 #from midterm import BarcodeData, Product
+
+pd = lazy_import("pandas")
 BarcodeDataTuple = namedtuple("BarcodeDataTuple", ["ascii_char", "barcode", "binary"])
 
+# Posted to an events queue for live monitors: kind is 'scan' (one lookup served,
+# latency in seconds) or 'cart' (price holds the cart total); unused fields are None
+ServerEvent = namedtuple("ServerEvent", ["kind", "barcode", "product", "price", "latency", "timestamp"])
+
 class BarcodeData:
     def __init__(self):
         self.df_barcode = pd.DataFrame()
@@ -48,6 +57,9 @@ class Product:
 
     def load_products(self, filepath: str):
         df_raw = pd.read_csv(filepath)
+        self.df_products = pd.DataFrame(self.encode_frame(df_raw))
+
+    def encode_frame(self, df_raw):
         product_records = []
 
         for _, row in df_raw.iterrows():
@@ -73,7 +85,14 @@ class Product:
                 print(f"Skipping '{name}': {e}")
                 continue
 
-        self.df_products = pd.DataFrame(product_records)
+        return product_records
+
+    def lookup(self, binary_code):
+        df = self.df_products
+        match = df[df["Binary Encoding"] == binary_code]
+        if not match.empty:
+            return match.iloc[0]["Product"], match.iloc[0]["Price"]
+        return None, None
 
 # Setup logging to file and console
 logging.basicConfig(
@@ -86,33 +105,49 @@ logging.basicConfig(
 )
 
 class BarcodeServer:
-    def __init__(self, host='127.0.0.1', port=8888):
+    def __init__(self, host='127.0.0.1', port=8888, catalog_db=None, snapshot=None, events=None):
         self.host = host
         self.port = port
         self.queue = Queue()
-
+        # Thread-safe queue.Queue fed a ServerEvent per lookup; put_nowait never blocks the loop
+        self.events = events
+
+        if snapshot:
+            # Memory-mapped compiled catalog, recompiled only when the CSVs change
+            self.product = load_snapshot(snapshot, self._load_encoder)
+        elif catalog_db:
+            # Serve lookups from the indexed SQLite catalog, built on first use
+            self.product = open_catalog(catalog_db, self._load_encoder)
+        else:
+            self.barcode_data = BarcodeData()
+            self.barcode_data.load_csv("bc3of9.csv")
+
+            self.product = Product(self.barcode_data)
+            self.product.load_products("Products.csv")
+
+    def _load_encoder(self):
         self.barcode_data = BarcodeData()
         self.barcode_data.load_csv("bc3of9.csv")
-
-        self.product = Product(self.barcode_data)
-        self.product.load_products("Products.csv")
+        return Product(self.barcode_data)
 
     async def handle_client(self, reader, writer):
         try:
             data = await reader.read(1024)
+            started = time.perf_counter()
             barcode = data.decode().strip()
             logging.info(f"[SERVER] Received encoded barcode: {barcode}")
 
-            result_row = self.product.df_products[self.product.df_products["Binary Encoding"] == barcode]
-            if not result_row.empty:
-                name = result_row.iloc[0]["Product"]
-                price = result_row.iloc[0]["Price"]
+            name, price = self.product.lookup(barcode)
+            if name is not None:
                 response = json.dumps({"Product": name, "Price": price})
             else:
                 response = json.dumps({"error": "Invalid barcode"})
 
             writer.write(response.encode())
             await writer.drain()
+            if self.events is not None:
+                self.events.put_nowait(ServerEvent("scan", barcode, name, price,
+                                                   time.perf_counter() - started, time.time()))
             writer.close()
             await writer.wait_closed()
 
@@ -140,7 +175,12 @@ async def send_barcode(barcode: str):
         return {"error": "Connection failed"}
 
 
-async def run_client():
+def _post_cart(events, total):
+    if events is not None:
+        events.put_nowait(ServerEvent("cart", None, None, total, None, time.time()))
+
+
+async def run_client(events=None):
     df = pd.read_csv("Carts.csv")
     df = df.fillna('').astype(str)
 
@@ -154,6 +194,7 @@ async def run_client():
                 continue
             if item == "---CART BREAK---":
                 logging.info(f"CART BREAK - Cart total: ${cart_total:.2f}")
+                _post_cart(events, cart_total)
                 cart_total = 0.0
                 continue
 
@@ -167,16 +208,17 @@ async def run_client():
                 logging.info(f"{item} => {name}: ${price:.2f}")
 
     logging.info(f"Final cart total: ${cart_total:.2f}")
+    _post_cart(events, cart_total)
     logging.info("===== CLIENT SESSION END =====")
 
 
-async def run_main():
-    server = BarcodeServer()
+async def run_main(catalog_db=None, snapshot=None, events=None):
+    server = BarcodeServer(catalog_db=catalog_db, snapshot=snapshot, events=events)
     server_task = asyncio.create_task(server.start())
 
     await asyncio.sleep(1)  # Let server start
 
-    await run_client()
+    await run_client(events)
 
     server_task.cancel()
     try:
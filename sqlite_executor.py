@@ -1,7 +1,11 @@
+from __future__ import annotations
+
 import sqlite3
-import pandas as pd
 import logging
 from typing import Any, List, Optional, Tuple, Union, Iterator
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
 
 logging.basicConfig(filename='log.txt', level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -16,7 +20,8 @@ class QueryBuilder:
             "SELECT_WHERE": self._select_where,
             "UPDATE": self._update,
             "DELETE": self._delete,
-            "JOIN_SELECT": self._join_select
+            "JOIN_SELECT": self._join_select,
+            "CREATE_INDEX": self._create_index
         }
 
     def query(self, query_type: str, df: Optional[pd.DataFrame] = None,
@@ -68,6 +73,11 @@ class QueryBuilder:
         clause = " AND ".join([f'"{col}" = ?' for col in where_columns])
         return f'DELETE FROM "{self.table_name}" WHERE {clause};'
 
+    def _create_index(self, df: pd.DataFrame, where_columns: List[str]):
+        cols = ", ".join([f'"{col}"' for col in where_columns])
+        index_name = "idx_" + "_".join([self.table_name] + [col.replace(" ", "_") for col in where_columns])
+        return f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "{self.table_name}" ({cols});'
+
     def _join_select(self, df: pd.DataFrame, join_table: str, join_condition: str, where_columns: Optional[List[str]]):
         cols = ", ".join([f'{self.table_name}."{col}"' for col in df.columns])
         query = f'SELECT {cols} FROM "{self.table_name}" JOIN "{join_table}" ON {join_condition}'
@@ -77,10 +87,11 @@ class QueryBuilder:
         return query + ";"
 
 class CommandExecutor:
-    def __init__(self, db_name: str = ":memory:"):
+    def __init__(self, db_name: str = ":memory:", verbose: bool = True):
         self.connection = sqlite3.connect(db_name)
         self.cursor = self.connection.cursor()
         self._last_result = []
+        self.verbose = verbose
 
     def execute(self, query: str, params: Optional[Tuple[Any, ...]] = None):
         logging.info("Executing SQL: %s", query)
@@ -94,7 +105,8 @@ class CommandExecutor:
             if query.strip().upper().startswith("SELECT"):
                 self._last_result = self.cursor.fetchall()
             self.connection.commit()
-            print("SQL command executed successfully.")
+            if self.verbose:
+                print("SQL command executed successfully.")
         except Exception as e:
             logging.exception("Execution failed")
             self.connection.rollback()
@@ -104,6 +116,17 @@ class CommandExecutor:
         for _, row in df.iterrows():
             self.execute(query, tuple(row.astype(str)))
 
+    def insert_many(self, query: str, rows: List[Tuple[Any, ...]]):
+        # One executemany + one commit instead of a commit per row
+        logging.info("Executing SQL (batch of %d): %s", len(rows), query)
+        try:
+            self.cursor.executemany(query, rows)
+            self.connection.commit()
+        except Exception as e:
+            logging.exception("Batch execution failed")
+            self.connection.rollback()
+            raise
+
     def fetch_df(self) -> pd.DataFrame:
         cols = [desc[0] for desc in self.cursor.description]
         return pd.DataFrame(self._last_result, columns=cols)
@@ -124,11 +147,13 @@ class CommandExecutor:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.connection.close()
-        print("Connection closed.")
+        if self.verbose:
+            print("Connection closed.")
 
     def __del__(self):
         self.connection.close()
-        print("Database connection cleaned up.")
+        if self.verbose:
+            print("Database connection cleaned up.")
 
 
 def main():
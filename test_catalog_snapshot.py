@@ -0,0 +1,79 @@
+"""Tests for catalog_snapshot against Product.lookup on a small CSV pair"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from catalog_snapshot import HEADER, RECORD, load_snapshot
+from midterm import BarcodeData, Product
+
+PRODUCTS = "Product,Price\nApple juice,1.50\nApples dried,2.00\nBread loaf,3.25\nKiwi,1.00\n"
+
+
+class Tests(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.barcodes = os.path.join(self.dir, "bc3of9.csv")
+        self.products = os.path.join(self.dir, "Products.csv")
+        self.path = os.path.join(self.dir, "catalog.snap")
+        shutil.copy(os.path.join(os.path.dirname(os.path.abspath(__file__)), "bc3of9.csv"), self.barcodes)
+        with open(self.products, "w") as f:
+            f.write(PRODUCTS)
+        self.builds = 0
+
+    def factory(self):
+        self.builds += 1
+        barcode_data = BarcodeData()
+        barcode_data.load_csv(self.barcodes)
+        return Product(barcode_data)
+
+    def load(self):
+        snapshot = load_snapshot(self.path, self.factory, self.barcodes, self.products)
+        self.addCleanup(snapshot.close)
+        return snapshot
+
+    def reference(self):
+        product = self.factory()
+        self.builds -= 1
+        product.load_products(self.products)
+        return product
+
+    def assertMatches(self, snapshot):
+        reference = self.reference()
+        codes = list(reference.df_products["Binary Encoding"]) + ["0101", "", "2"]
+        for code in codes:
+            self.assertEqual(snapshot.lookup(code), reference.lookup(code), code)
+        self.assertEqual(len(snapshot), len(reference.df_products))
+
+    def test_lookup(self):
+        snapshot = self.load()
+        self.assertEqual(self.builds, 1)
+        self.assertMatches(snapshot)
+        # Duplicated code (APPLE): the first product wins, as in Product.lookup
+        code = self.reference().df_products["Binary Encoding"][0]
+        self.assertEqual(snapshot.lookup(code), ("Apple juice", 1.5))
+        self.load()
+        self.assertEqual(self.builds, 1)  # Fresh snapshot reused
+
+    def test_rebuilt_when_csv_changes(self):
+        self.load().close()
+        with open(self.products, "a") as f:
+            f.write("Cheese block,4.00\n")
+        snapshot = self.load()
+        self.assertEqual(self.builds, 2)
+        self.assertMatches(snapshot)
+
+    def test_rebuilt_when_truncated(self):
+        self.load().close()
+        for length in (20, HEADER.size + RECORD.size, 0):  # Inside the header, inside the records, empty
+            with open(self.path, "r+b") as f:
+                f.truncate(length)
+            snapshot = self.load()
+            self.assertMatches(snapshot)
+            snapshot.close()
+        self.assertEqual(self.builds, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Tests for dfmodule's typed DataFrame builder"""
+import unittest
+
+from bs4 import BeautifulSoup
+from pandas.testing import assert_frame_equal
+
+from dfmodule import htmlToDf, streamToDf, tableGrid, typeColumn
+from WebScraper import stream_table_rows
+
+
+class Tests(unittest.TestCase):
+    def test_numeric(self):
+        self.assertEqual(typeColumn(["1,234", "$5", "-7"]).tolist(), [1234, 5, -7])
+        self.assertEqual(str(typeColumn(["1", "2", "300"]).dtype), "int16")
+        self.assertEqual(str(typeColumn(["1.5", "2.25", ""]).dtype), "float32")
+        self.assertEqual(str(typeColumn(["1234567.89", "2"]).dtype), "float64")
+        self.assertEqual(typeColumn(["1", "2", ""]).tolist()[:2], [1.0, 2.0])
+
+    def test_text_kept(self):
+        # Not thousands grouping, leading-zero codes, past int64, past float64 precision
+        for values in (["1,2", "3"], ["3 4", "5"], ["00501", "10001"],
+                       ["99999999999999999999", "1"], ["0.1000000000000000055511", "1.5"],
+                       ["9007199254740993", ""]):
+            column = typeColumn(values, categorical_ratio=0)
+            self.assertEqual(column.dtype, object, values)
+            self.assertEqual(column.dropna().tolist(), [v for v in values if v], values)
+
+    def test_category(self):
+        self.assertEqual(str(typeColumn(["a", "a", "b", "a"]).dtype), "category")
+        self.assertEqual(str(typeColumn(["02134", "02134", "02134"]).dtype), "category")
+
+    def test_nested_table(self):
+        soup = BeautifulSoup("<table><tr><th>A</th><th>B</th></tr>"
+                             "<tr><td><table><tr><td>x</td></tr><tr><td>y</td></tr></table></td><td>1</td></tr>"
+                             "<tr><td rowspan='2'>2</td><td>3</td></tr><tr><td>4</td></tr></table>", "html.parser")
+        outer, inner = soup.find_all("table")
+        self.assertEqual(tableGrid(outer), (["A", "B"], [["xy", "1"], ["2", "3"], ["2", "4"]]))
+        self.assertEqual(tableGrid(inner), (None, [["x"], ["y"]]))
+
+    def test_stream_matches_htmlToDf(self):
+        tables = {
+            "plain": "<tr><th>A</th><th>B</th></tr><tr><td>1</td><td>2</td></tr>"
+                     "<tr><td>short</td></tr><tr><th>label</th><td>3</td><td>4</td></tr>",
+            "mixed header": "<tr><th>A</th><td>x</td><th>B</th></tr><tr><td>1</td><td>2</td></tr>",
+            "no header": "<tr><td>1</td><td>2</td></tr><tr><td>3</td><td>4</td></tr>",
+            "header only": "<tr><th>A</th><th>B</th></tr>",
+        }
+        html = "".join(f"<h2>{name}</h2><table>{body}</table>" for name, body in tables.items())
+        soup = BeautifulSoup(html, "html.parser")
+        for index, name in enumerate(tables):
+            expected = htmlToDf(soup.find_all("table")[index], cache=None)
+            chunks = [html[i:i + 7] for i in range(0, len(html), 7)]
+            assert_frame_equal(streamToDf(stream_table_rows(chunks), heading=name), expected, obj=name)
+            assert_frame_equal(streamToDf(stream_table_rows([html]), table=index, batch_size=1), expected, obj=name)
+
+
+if __name__ == "__main__":
+    unittest.main()
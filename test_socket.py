@@ -2,11 +2,14 @@ import asyncio
 import json
 import logging
 import queue
-import pandas as pd
+from catalog_store import open_catalog
+from catalog_snapshot import load_snapshot
+from lazy_imports import lazy_import
 #from midterm import BarcodeData, Product, Cart
-import pandas as pd
 from collections import namedtuple
 
+pd = lazy_import("pandas")
+
 # --------------------------
 # BarcodeData Class
 # --------------------------
@@ -53,6 +56,9 @@ class Product:
 
     def load_products(self, filepath: str):
         df_raw = pd.read_csv(filepath)
+        self.df_products = pd.DataFrame(self.encode_frame(df_raw))
+
+    def encode_frame(self, df_raw):
         product_records = []
 
         for _, row in df_raw.iterrows():
@@ -78,7 +84,14 @@ class Product:
                 print(f"Skipping '{name}': {e}")
                 continue
 
-        self.df_products = pd.DataFrame(product_records)
+        return product_records
+
+    def lookup(self, binary_code):
+        df = self.df_products
+        match = df[df["Binary Encoding"] == binary_code]
+        if not match.empty:
+            return match.iloc[0]["Product"], match.iloc[0]["Price"]
+        return None, None
 
 
 # --------------------------
@@ -97,11 +110,8 @@ class Cart:
         self.carts = [cart.split(',') for cart in raw_carts]
 
     def decode_product(self, binary_code):
-        df = self.product_model.df_products
-        match = df[df["Binary Encoding"] == binary_code]
-        if not match.empty:
-            return match.iloc[0]["Product"], match.iloc[0]["Price"]
-        return None, None
+        # product_model is a Product or a CatalogStore; both expose lookup()
+        return self.product_model.lookup(binary_code)
 
     def generate_receipts(self):
         self.receipts = []  # Clear any previous receipts
@@ -175,16 +185,30 @@ logging.basicConfig(
 )
 
 # Load models
-barcode_data = BarcodeData()
-barcode_data.load_csv("bc3of9.csv")
-product_model = Product(barcode_data)
-product_model.load_products("Products.csv")
+def load_encoder():
+    barcode_data = BarcodeData()
+    barcode_data.load_csv("bc3of9.csv")
+    return Product(barcode_data)
+
+# Compiled snapshot: mapped as-is unless bc3of9.csv / Products.csv changed.
+# Loaded on first use rather than at import.
+_product_model = None
+
+def get_product_model():
+    global _product_model
+    if _product_model is None:
+        _product_model = load_snapshot("catalog.snap", load_encoder)
+    return _product_model
 
 # Server class
 class BarcodeServer:
-    def __init__(self, host='127.0.0.1', port=8888):
+    def __init__(self, host='127.0.0.1', port=8888, catalog_db=None):
         self.host = host
         self.port = port
+        if catalog_db:
+            self.product_model = open_catalog(catalog_db, load_encoder)
+        else:
+            self.product_model = get_product_model()
 
     async def handle_client(self, reader, writer):
         try:
@@ -192,10 +216,8 @@ class BarcodeServer:
             barcode = data.decode().strip()
             logging.info(f"[SERVER] Received barcode: {barcode}")
 
-            match = product_model.df_products[product_model.df_products["Binary Encoding"] == barcode]
-            if not match.empty:
-                product = match.iloc[0]["Product"]
-                price = match.iloc[0]["Price"]
+            product, price = self.product_model.lookup(barcode)
+            if product is not None:
                 result = {"Product": product, "Price": price}
             else:
                 result = {"Error": "Invalid barcode"}
@@ -234,10 +256,11 @@ async def send_cart(cart_barcodes):
     return cart_results
 
 # Runner
-async def run_main():
-    cart_model = Cart(product_model)
+async def run_main(catalog_db=None):
+    server = BarcodeServer(catalog_db=catalog_db)
+    cart_model = Cart(server.product_model)
     cart_model.load_carts("Carts.csv")
-    server_task = asyncio.create_task(BarcodeServer().start())
+    server_task = asyncio.create_task(server.start())
     await asyncio.sleep(1)  # Give server time to boot
 
     all_receipts = []
@@ -0,0 +1,184 @@
+"""Tests for WebScraper, kept out of the module so importing it doesn't load unittest"""
+import threading
+import unittest
+from collections import defaultdict
+
+from WebScraper import (FileHandler, HttpCache, TableRow, TableScraperRE, compare_scrapers_many,
+                        scrape_many, stream_table_rows)
+
+
+class Tests(unittest.TestCase):
+    """FileHandler against a local http.server stand-in"""
+
+    def setUp(self):
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+        hits = self.hits = defaultdict(int)
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits[self.path] += 1
+                if self.path == '/flaky' and hits[self.path] == 1:
+                    self.send_response(503)  # Retried by the session
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                if self.path == '/missing':
+                    self.send_error(404)
+                    return
+                body = f"<table><tr><td>{self.path}</td></tr></table>".encode()
+                etag = f'"{self.path}-v1"'
+                if self.path == '/cached' and self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                if self.path == '/cached':
+                    self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_fetch_many(self):
+        handler = FileHandler(timeout=5, retries=2, backoff=0)
+        urls = [f"{self.base}/page{i}" for i in range(10)] + [f"{self.base}/flaky", f"{self.base}/missing"]
+        pages = handler.fetch_many(urls, max_workers=4, per_host=2)
+        handler.close()
+
+        self.assertEqual(pages[f"{self.base}/page3"], "<table><tr><td>/page3</td></tr></table>")
+        self.assertEqual(pages[f"{self.base}/flaky"], "<table><tr><td>/flaky</td></tr></table>")
+        self.assertEqual(self.hits['/flaky'], 2)
+        self.assertIsNone(pages[f"{self.base}/missing"])
+
+    def test_one_session(self):
+        import requests
+        from unittest import mock
+        created = []
+        session_init = requests.Session.__init__
+
+        def counting_init(session):
+            created.append(session)
+            session_init(session)
+
+        with mock.patch.object(requests.Session, '__init__', counting_init):
+            handler = FileHandler()
+            handler.fetch_many([f"{self.base}/page{i}" for i in range(16)], max_workers=8)
+            handler.read_webpage(f"{self.base}/page0")
+        self.assertEqual(len(created), 1)
+        handler.close()
+
+    def test_cache(self):
+        import tempfile
+        with tempfile.TemporaryDirectory() as directory:
+            cache = HttpCache(directory, max_bytes=1024)
+            handler = FileHandler(cache=cache)
+            url = f"{self.base}/cached"
+            first = handler.read_webpage(url)
+            second = handler.read_webpage(url)  # 304, body from disk
+            self.assertEqual(first, second)
+            self.assertEqual(self.hits['/cached'], 2)
+            self.assertEqual(cache.lookup(url)['etag'], '"/cached-v1"')
+            self.assertIsNone(cache.lookup(f"{self.base}/page1"))  # No validator, not cached
+
+            HttpCache(directory, max_bytes=0).store(url, type('R', (), {
+                'headers': {'ETag': '"x"'}, 'encoding': 'utf-8', 'content': b'abc'})())
+            self.assertIsNone(cache.lookup(url))  # Evicted over the size bound
+            handler.close()
+
+    def test_cache_evicted_during_revalidation(self):
+        import os
+        import tempfile
+        with tempfile.TemporaryDirectory() as directory:
+            cache = HttpCache(directory)
+            handler = FileHandler(cache=cache)
+            url = f"{self.base}/cached"
+            first = handler.read_webpage(url)
+
+            session_get = handler.session.get
+
+            def evict_then_get(*args, **kwargs):
+                # Another thread's eviction lands between lookup() and the 304
+                for name in os.listdir(directory):
+                    os.remove(os.path.join(directory, name))
+                return session_get(*args, **kwargs)
+
+            handler.session.get = evict_then_get
+            self.assertEqual(handler.read_webpage(url), first)
+            self.assertEqual(self.hits['/cached'], 3)  # 200, 304, unconditional 200
+            self.assertIsNotNone(cache.lookup(url))  # Stored again
+            handler.close()
+
+    def test_scrape_many(self):
+        urls = [f"{self.base}/page{i}" for i in range(3)] + [f"{self.base}/missing"]
+        comparison = compare_scrapers_many(urls, max_workers=2)
+        self.assertEqual(comparison[urls[-1]], (None, None))
+        for url in urls[:-1]:
+            re_stats, bs4_stats = comparison[url]
+            self.assertEqual(re_stats['td'], 1)
+            self.assertEqual(bs4_stats, {'table': 1, 'thead': 0, 'tbody': 0, 'tfoot': 0, 'tr': 1, 'th': 0, 'td': 1})
+
+        html = "<h2>Prices</h2><table><tr><th>item</th><th>cost</th></tr><tr><td>a</td><td>1</td></tr></table>"
+        [result] = scrape_many([html, html], engines=('bs4',), frames=True, max_workers=2)[:1]
+        self.assertNotIn('re', result)
+        self.assertEqual(str(result['frames']['Prices']['cost'].dtype), 'int8')
+
+    def test_stream_chunk_boundaries(self):
+        page = ("<h2>Big  Cities</h2><table><tr><th>City name</th><th>State</th></tr>"
+                "<tr><td>New York</td><td>N<b>Y</b></td></tr><tr><td> Salt Lake <!-- x --> City </td>"
+                "<td>Utah &amp; co</td></tr></table>")
+        whole = list(stream_table_rows([page]))
+        self.assertEqual(whole[1].cells, ['New York', 'NY'])
+        self.assertEqual(whole[2].cells, ['Salt LakeCity', 'Utah & co'])  # get_text(strip=True) per node
+        self.assertEqual(whole[0].heading, 'Big  Cities')
+        self.assertEqual(list(stream_table_rows(page)), whole)  # 1-character chunks
+        self.assertEqual(list(stream_table_rows([page[i:i + 1].encode() for i in range(len(page))])), whole)
+
+    def test_streaming(self):
+        rows = list(stream_table_rows(FileHandler().iter_webpage(f"{self.base}/streamed", chunk_size=8)))
+        self.assertEqual(rows, [TableRow(0, None, ['/streamed'], False, ['td'])])
+
+
+
+class TokenizerTests(unittest.TestCase):
+    """TableScraperRE.tokenize_tables, no server needed"""
+
+    HTML = ("<table><thead><tr><th>A<th>B</thead>"
+            "<!-- <td>commented</td> --><tr><td>1<td><table><tr><td>in</td></tr></table></table>")
+
+    def test_tokenize(self):
+        data = TableScraperRE().tokenize_tables(self.HTML)
+        self.assertEqual(data['thead'], ["<tr><th>A<th>B"])
+        self.assertEqual(data['th'], ["A", "B"])  # Not <thead>, closed by the next <th> and </thead>
+        self.assertEqual(data['td'], ["1", "<table><tr><td>in</td></tr></table>", "in"])
+        self.assertEqual(len(data['table']), 2)
+        self.assertTrue(data['table'][0].endswith("</table>"))  # Outer table keeps the nested one
+
+    def test_structure(self):
+        scraper = TableScraperRE()
+        scraper.tokenize_tables(self.HTML)
+        self.assertEqual(scraper.structure, [])
+        scraper.tokenize_tables(self.HTML, structure=True)
+
+        def shape(node):
+            return node['tag'], [shape(child) for child in node['children']]
+        self.assertEqual([shape(node) for node in scraper.structure],
+                         [('table', [('thead', [('tr', [('th', []), ('th', [])])]),
+                                     ('tr', [('td', []), ('td', [('table', [('tr', [('td', [])])])])])])])
+        outer = scraper.structure[0]
+        self.assertEqual(self.HTML[outer['start']:outer['end']], scraper.table_data['table'][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,14 @@
+from __future__ import annotations
+
 import asyncio
-import pandas as pd
-import aiosqlite
 import sqlite3
 import logging
 from typing import Any, List, Optional, Tuple, Union, Iterator
 import os
+from lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+aiosqlite = lazy_import("aiosqlite")
 
 logging.basicConfig(filename='log.txt', level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 